@@ -1,10 +1,11 @@
 """Input/output methods for model predictions."""
 
-import copy
+import functools
+import itertools
 import os.path
+import re
 import numpy
 import netCDF4
-from gewittergefahr.gg_utils import time_conversion
 from gewittergefahr.gg_utils import prob_matched_means as pmm
 from gewittergefahr.gg_utils import longitude_conversion as lng_conversion
 from gewittergefahr.gg_utils import file_system_utils
@@ -14,6 +15,10 @@ from ml4rt.machine_learning import neural_net
 
 TOLERANCE = 1e-6
 
+MAX_EXAMPLES_PER_VECTOR_CHUNK = 8192
+MAX_EXAMPLES_PER_SCALAR_CHUNK = 65536
+DEFAULT_NUM_ID_CHARACTERS = 128
+
 EXAMPLE_DIMENSION_KEY = 'example'
 HEIGHT_DIMENSION_KEY = 'height'
 VECTOR_TARGET_DIMENSION_KEY = 'vector_target'
@@ -48,11 +53,78 @@ METADATA_KEYS = [
     GRID_ROW_KEY, GRID_COLUMN_KEY
 ]
 
+# Group names must match METADATA_KEYS, with underscores instead of dashes.
+_FILE_NAME_METADATA_REGEX = re.compile(
+    r'_(?:'
+    r'zenith-angle-bin=(?P<zenith_angle_bin>\d+)|'
+    r'albedo-bin=(?P<albedo_bin>\d+)|'
+    r'month=(?P<month>\d+)|'
+    r'grid-row=(?P<grid_row>\d+)_grid-column=(?P<grid_column>\d+)'
+    r')$'
+)
+
 GRID_ROW_DIMENSION_KEY = 'row'
 GRID_COLUMN_DIMENSION_KEY = 'column'
 LATITUDES_KEY = 'latitude_deg_n'
 LONGITUDES_KEY = 'longitude_deg_e'
 
+_PARSED_IDS_KEY = '__parsed_example_ids'
+
+
+def _parse_example_ids_cached(prediction_dict):
+    """Parses example IDs in dictionary, caching the result.
+
+    The parsed IDs are stored back in `prediction_dict` under a private key,
+    so that chained subset operations do not re-parse the same ID list.  Any
+    method that rewrites the ID list must remove the cached parse.
+
+    :param prediction_dict: See doc for `write_file`.
+    :return: example_id_dict: See doc for `example_utils.parse_example_ids`.
+    """
+
+    if _PARSED_IDS_KEY not in prediction_dict:
+        prediction_dict[_PARSED_IDS_KEY] = example_utils.parse_example_ids(
+            prediction_dict[EXAMPLE_IDS_KEY]
+        )
+
+    return prediction_dict[_PARSED_IDS_KEY]
+
+
+@functools.lru_cache(maxsize=128)
+def _list_directory(directory_name):
+    """Returns names of all files in directory (memoized).
+
+    Memoizing the listing turns N existence checks in the same directory into
+    one scandir call instead of N stat calls.  `write_file` clears the cache
+    after creating a new file; other writers should call
+    `_list_directory.cache_clear()` themselves.
+
+    :param directory_name: Path to directory.
+    :return: pathless_file_names: frozenset of file names in directory (empty
+        if directory does not exist).
+    """
+
+    try:
+        return frozenset(os.listdir(directory_name))
+    except OSError:
+        return frozenset()
+
+
+def _as_float32(matrix):
+    """Casts matrix to contiguous float32, copying only if necessary.
+
+    Casting before the netCDF write lets netCDF4 stream the bytes straight to
+    its buffers, instead of casting element-wise inside the write loop.
+
+    :param matrix: numpy array.
+    :return: matrix: Same as input but guaranteed contiguous float32.
+    """
+
+    if matrix.dtype == numpy.float32 and matrix.flags['C_CONTIGUOUS']:
+        return matrix
+
+    return numpy.ascontiguousarray(matrix, dtype=numpy.float32)
+
 
 def find_file(
         directory_name, zenith_angle_bin=None, albedo_bin=None, month=None,
@@ -128,11 +200,14 @@ def find_file(
             directory_name, grid_row, grid_column
         )
 
-    if raise_error_if_missing and not os.path.isfile(prediction_file_name):
-        error_string = 'Cannot find file.  Expected at: "{0:s}"'.format(
-            prediction_file_name
-        )
-        raise ValueError(error_string)
+    if raise_error_if_missing:
+        this_dir_name, pathless_file_name = os.path.split(prediction_file_name)
+
+        if pathless_file_name not in _list_directory(this_dir_name):
+            error_string = 'Cannot find file.  Expected at: "{0:s}"'.format(
+                prediction_file_name
+            )
+            raise ValueError(error_string)
 
     return prediction_file_name
 
@@ -159,23 +234,14 @@ def file_name_to_metadata(prediction_file_name):
 
     pathless_file_name = os.path.split(prediction_file_name)[-1]
     extensionless_file_name = os.path.splitext(pathless_file_name)[0]
-    words = extensionless_file_name.split('_')
-
-    for this_key in METADATA_KEYS:
-        this_key_with_dashes = this_key.replace('_', '-')
-        if this_key_with_dashes not in words[-1]:
-            continue
 
-        metadata_dict[this_key] = int(
-            words[-1].replace(this_key_with_dashes + '=', '')
-        )
-        break
+    match_object = _FILE_NAME_METADATA_REGEX.search(extensionless_file_name)
+    if match_object is None:
+        return metadata_dict
 
-    if metadata_dict[GRID_COLUMN_KEY] is not None:
-        this_key_with_dashes = GRID_ROW_KEY.replace('_', '-')
-        metadata_dict[GRID_ROW_KEY] = int(
-            words[-2].replace(this_key_with_dashes + '=', '')
-        )
+    for this_key, this_value in match_object.groupdict().items():
+        if this_value is not None:
+            metadata_dict[this_key] = int(this_value)
 
     return metadata_dict
 
@@ -183,7 +249,9 @@ def file_name_to_metadata(prediction_file_name):
 def write_file(
         netcdf_file_name, scalar_target_matrix, vector_target_matrix,
         scalar_prediction_matrix, vector_prediction_matrix, heights_m_agl,
-        example_id_strings, model_file_name, isotonic_model_file_name=None):
+        example_id_strings, model_file_name, isotonic_model_file_name=None,
+        scalar_least_significant_digit=None,
+        vector_least_significant_digit=None, skip_checks=False):
     """Writes predictions to NetCDF file.
 
     E = number of examples
@@ -210,59 +278,98 @@ def write_file(
         regression models (readable by `isotonic_regression.read_file`) used to
         make predictions.  If isotonic regression was not used, leave this as
         None.
+    :param scalar_least_significant_digit: Number of decimal digits to keep for
+        scalar targets and predictions.  Truncating trailing mantissa bits
+        improves the deflate ratio.  If you do not want truncation, leave this
+        as None.
+    :param vector_least_significant_digit: Same but for vector targets and
+        predictions.
+    :param skip_checks: Boolean flag.  If True, all input-checking will be
+        skipped.  Use only when the caller can guarantee valid inputs, e.g.,
+        arrays that came straight out of `read_file`.
     """
 
+    error_checking.assert_is_boolean(skip_checks)
+
+    if isotonic_model_file_name is None:
+        isotonic_model_file_name = ''
+
     # Check input args.
-    error_checking.assert_is_numpy_array_without_nan(scalar_target_matrix)
-    error_checking.assert_is_numpy_array(scalar_target_matrix, num_dimensions=2)
+    if not skip_checks:
+        error_checking.assert_is_numpy_array(
+            scalar_target_matrix, num_dimensions=2
+        )
+        error_checking.assert_is_numpy_array(
+            scalar_prediction_matrix,
+            exact_dimensions=numpy.array(scalar_target_matrix.shape, dtype=int)
+        )
+        error_checking.assert_is_numpy_array(
+            vector_target_matrix, num_dimensions=3
+        )
 
-    error_checking.assert_is_numpy_array_without_nan(scalar_prediction_matrix)
-    error_checking.assert_is_numpy_array(
-        scalar_prediction_matrix,
-        exact_dimensions=numpy.array(scalar_target_matrix.shape, dtype=int)
-    )
+        num_examples = scalar_target_matrix.shape[0]
+        expected_dim = numpy.array(
+            (num_examples,) + vector_target_matrix.shape[1:], dtype=int
+        )
+        error_checking.assert_is_numpy_array(
+            vector_target_matrix, exact_dimensions=expected_dim
+        )
+
+        error_checking.assert_is_numpy_array(
+            vector_prediction_matrix,
+            exact_dimensions=numpy.array(vector_target_matrix.shape, dtype=int)
+        )
 
-    error_checking.assert_is_numpy_array_without_nan(vector_target_matrix)
-    error_checking.assert_is_numpy_array(vector_target_matrix, num_dimensions=3)
+        if not (
+                numpy.isfinite(scalar_target_matrix).all() and
+                numpy.isfinite(scalar_prediction_matrix).all() and
+                numpy.isfinite(vector_target_matrix).all() and
+                numpy.isfinite(vector_prediction_matrix).all()
+        ):
+            raise ValueError(
+                'Target and prediction matrices must not contain NaN or '
+                'infinite values.'
+            )
 
-    num_examples = scalar_target_matrix.shape[0]
-    expected_dim = numpy.array(
-        (num_examples,) + vector_target_matrix.shape[1:], dtype=int
-    )
-    error_checking.assert_is_numpy_array(
-        vector_target_matrix, exact_dimensions=expected_dim
-    )
+        num_heights = vector_target_matrix.shape[1]
+        error_checking.assert_is_greater_numpy_array(heights_m_agl, 0.)
+        error_checking.assert_is_numpy_array(
+            heights_m_agl,
+            exact_dimensions=numpy.array([num_heights], dtype=int)
+        )
 
-    error_checking.assert_is_numpy_array_without_nan(vector_prediction_matrix)
-    error_checking.assert_is_numpy_array(
-        vector_prediction_matrix,
-        exact_dimensions=numpy.array(vector_target_matrix.shape, dtype=int)
-    )
+        error_checking.assert_is_numpy_array(
+            numpy.array(example_id_strings),
+            exact_dimensions=numpy.array([num_examples], dtype=int)
+        )
+        example_utils.parse_example_ids(example_id_strings)
 
-    num_heights = vector_target_matrix.shape[1]
-    error_checking.assert_is_greater_numpy_array(heights_m_agl, 0.)
-    error_checking.assert_is_numpy_array(
-        heights_m_agl,
-        exact_dimensions=numpy.array([num_heights], dtype=int)
-    )
+        error_checking.assert_is_string(model_file_name)
+        error_checking.assert_is_string(isotonic_model_file_name)
 
-    error_checking.assert_is_numpy_array(
-        numpy.array(example_id_strings),
-        exact_dimensions=numpy.array([num_examples], dtype=int)
-    )
-    example_utils.parse_example_ids(example_id_strings)
+        if scalar_least_significant_digit is not None:
+            error_checking.assert_is_integer(scalar_least_significant_digit)
+            error_checking.assert_is_geq(scalar_least_significant_digit, 0)
 
-    error_checking.assert_is_string(model_file_name)
-    if isotonic_model_file_name is None:
-        isotonic_model_file_name = ''
-    error_checking.assert_is_string(isotonic_model_file_name)
+        if vector_least_significant_digit is not None:
+            error_checking.assert_is_integer(vector_least_significant_digit)
+            error_checking.assert_is_geq(vector_least_significant_digit, 0)
+
+    scalar_target_matrix = _as_float32(scalar_target_matrix)
+    scalar_prediction_matrix = _as_float32(scalar_prediction_matrix)
+    vector_target_matrix = _as_float32(vector_target_matrix)
+    vector_prediction_matrix = _as_float32(vector_prediction_matrix)
 
     # Write to NetCDF file.
     file_system_utils.mkdir_recursive_if_necessary(file_name=netcdf_file_name)
     dataset_object = netCDF4.Dataset(
-        netcdf_file_name, 'w', format='NETCDF3_64BIT_OFFSET'
+        netcdf_file_name, 'w', format='NETCDF4'
     )
 
+    # Every variable is written in full right after creation, so pre-filling
+    # with the default fill value would just double the bytes written.
+    dataset_object.set_fill_off()
+
     dataset_object.setncattr(MODEL_FILE_KEY, model_file_name)
     dataset_object.setncattr(ISOTONIC_MODEL_FILE_KEY, isotonic_model_file_name)
 
@@ -281,43 +388,82 @@ def write_file(
             SCALAR_TARGET_DIMENSION_KEY, scalar_target_matrix.shape[1]
         )
 
+    example_id_array = numpy.asarray(example_id_strings, dtype=numpy.str_)
+
     if num_examples == 0:
         num_id_characters = 1
     else:
-        num_id_characters = numpy.max(numpy.array([
-            len(id) for id in example_id_strings
-        ]))
+        num_id_characters = int(
+            numpy.char.str_len(example_id_array).max()
+        )
 
     dataset_object.createDimension(EXAMPLE_ID_CHAR_DIM_KEY, num_id_characters)
 
     this_string_format = 'S{0:d}'.format(num_id_characters)
-    example_ids_char_array = netCDF4.stringtochar(numpy.array(
-        example_id_strings, dtype=this_string_format
-    ))
+    example_ids_char_array = example_id_array.astype(this_string_format).view(
+        'S1'
+    ).reshape(num_examples, num_id_characters)
+
+    # Example IDs are always read in full, so small files store them
+    # contiguously, skipping chunk-cache bookkeeping; large files keep
+    # example-dimension chunks.
+    if num_examples >= MAX_EXAMPLES_PER_SCALAR_CHUNK:
+        example_id_chunk_sizes = (
+            MAX_EXAMPLES_PER_SCALAR_CHUNK, num_id_characters
+        )
+    else:
+        example_id_chunk_sizes = None
 
     dataset_object.createVariable(
         EXAMPLE_IDS_KEY, datatype='S1',
-        dimensions=(EXAMPLE_DIMENSION_KEY, EXAMPLE_ID_CHAR_DIM_KEY)
-    )
-    dataset_object.variables[EXAMPLE_IDS_KEY][:] = numpy.array(
-        example_ids_char_array
+        dimensions=(EXAMPLE_DIMENSION_KEY, EXAMPLE_ID_CHAR_DIM_KEY),
+        contiguous=num_examples > 0 and example_id_chunk_sizes is None,
+        chunksizes=example_id_chunk_sizes, fill_value=False
     )
+    dataset_object.variables[EXAMPLE_IDS_KEY][:] = example_ids_char_array
 
     dataset_object.createVariable(
-        HEIGHTS_KEY, datatype=numpy.float32, dimensions=HEIGHT_DIMENSION_KEY
+        HEIGHTS_KEY, datatype=numpy.float32, dimensions=HEIGHT_DIMENSION_KEY,
+        contiguous=True, fill_value=False
     )
     dataset_object.variables[HEIGHTS_KEY][:] = heights_m_agl
 
+    num_heights = vector_target_matrix.shape[1]
+
+    # Chunk shapes are tuned for the two common read patterns: one example's
+    # full profile (one chunk) or one target variable across all examples
+    # (few chunks, since each chunk spans many examples).
+    if num_examples > 0 and num_scalar_targets > 0:
+        scalar_chunk_sizes = (
+            min(num_examples, MAX_EXAMPLES_PER_SCALAR_CHUNK),
+            num_scalar_targets
+        )
+    else:
+        scalar_chunk_sizes = None
+
+    if num_examples > 0:
+        vector_chunk_sizes = (
+            min(num_examples, MAX_EXAMPLES_PER_VECTOR_CHUNK), num_heights, 1
+        )
+    else:
+        vector_chunk_sizes = None
+
     if num_scalar_targets > 0:
         dataset_object.createVariable(
             SCALAR_TARGETS_KEY, datatype=numpy.float32,
-            dimensions=(EXAMPLE_DIMENSION_KEY, SCALAR_TARGET_DIMENSION_KEY)
+            dimensions=(EXAMPLE_DIMENSION_KEY, SCALAR_TARGET_DIMENSION_KEY),
+            zlib=True, complevel=1, shuffle=True,
+            chunksizes=scalar_chunk_sizes, fill_value=False,
+            least_significant_digit=scalar_least_significant_digit
         )
         dataset_object.variables[SCALAR_TARGETS_KEY][:] = scalar_target_matrix
 
         dataset_object.createVariable(
             SCALAR_PREDICTIONS_KEY, datatype=numpy.float32,
-            dimensions=(EXAMPLE_DIMENSION_KEY, SCALAR_TARGET_DIMENSION_KEY)
+            dimensions=(EXAMPLE_DIMENSION_KEY, SCALAR_TARGET_DIMENSION_KEY),
+            zlib=True, complevel=1, shuffle=True,
+            chunksizes=scalar_chunk_sizes, fill_value=False,
+            least_significant_digit=scalar_least_significant_digit
         )
         dataset_object.variables[SCALAR_PREDICTIONS_KEY][:] = (
             scalar_prediction_matrix
@@ -328,19 +474,198 @@ def write_file(
     )
 
     dataset_object.createVariable(
-        VECTOR_TARGETS_KEY, datatype=numpy.float32, dimensions=these_dimensions
+        VECTOR_TARGETS_KEY, datatype=numpy.float32, dimensions=these_dimensions,
+        zlib=True, complevel=1, shuffle=True, chunksizes=vector_chunk_sizes,
+        fill_value=False,
+        least_significant_digit=vector_least_significant_digit
     )
     dataset_object.variables[VECTOR_TARGETS_KEY][:] = vector_target_matrix
 
     dataset_object.createVariable(
         VECTOR_PREDICTIONS_KEY, datatype=numpy.float32,
-        dimensions=these_dimensions
+        dimensions=these_dimensions,
+        zlib=True, complevel=1, shuffle=True, chunksizes=vector_chunk_sizes,
+        fill_value=False,
+        least_significant_digit=vector_least_significant_digit
     )
     dataset_object.variables[VECTOR_PREDICTIONS_KEY][:] = (
         vector_prediction_matrix
     )
 
     dataset_object.close()
+    _list_directory.cache_clear()
+
+
+def open_appendable_file(
+        netcdf_file_name, heights_m_agl, num_scalar_targets,
+        num_vector_targets, model_file_name, isotonic_model_file_name=None,
+        num_id_characters=DEFAULT_NUM_ID_CHARACTERS):
+    """Opens NetCDF file to which predictions can be appended batchwise.
+
+    Unlike `write_file`, which needs every example in memory at once, this
+    method creates a file with an unlimited example dimension, so that
+    inference scripts can stream one batch at a time via `append_to_file` and
+    keep peak memory at one batch.  The finished file is readable by
+    `read_file`.
+
+    H = number of heights
+
+    :param netcdf_file_name: Path to output file.
+    :param heights_m_agl: length-H numpy array of heights (metres above ground
+        level).
+    :param num_scalar_targets: Number of scalar target variables.
+    :param num_vector_targets: Number of vector target variables.
+    :param model_file_name: See doc for `write_file`.
+    :param isotonic_model_file_name: Same.
+    :param num_id_characters: Max number of characters in one example ID.
+    :return: dataset_object: Handle to open file (instance of
+        `netCDF4.Dataset`).  Pass this to `append_to_file` and, when done, to
+        `close_appendable_file`.
+    """
+
+    error_checking.assert_is_numpy_array(heights_m_agl, num_dimensions=1)
+    error_checking.assert_is_greater_numpy_array(heights_m_agl, 0.)
+    error_checking.assert_is_integer(num_scalar_targets)
+    error_checking.assert_is_geq(num_scalar_targets, 0)
+    error_checking.assert_is_integer(num_vector_targets)
+    error_checking.assert_is_greater(num_vector_targets, 0)
+    error_checking.assert_is_string(model_file_name)
+
+    if isotonic_model_file_name is None:
+        isotonic_model_file_name = ''
+    error_checking.assert_is_string(isotonic_model_file_name)
+
+    error_checking.assert_is_integer(num_id_characters)
+    error_checking.assert_is_greater(num_id_characters, 0)
+
+    file_system_utils.mkdir_recursive_if_necessary(file_name=netcdf_file_name)
+    dataset_object = netCDF4.Dataset(netcdf_file_name, 'w', format='NETCDF4')
+    dataset_object.set_fill_off()
+
+    dataset_object.setncattr(MODEL_FILE_KEY, model_file_name)
+    dataset_object.setncattr(ISOTONIC_MODEL_FILE_KEY, isotonic_model_file_name)
+
+    num_heights = len(heights_m_agl)
+    dataset_object.createDimension(EXAMPLE_DIMENSION_KEY, None)
+    dataset_object.createDimension(HEIGHT_DIMENSION_KEY, num_heights)
+    dataset_object.createDimension(
+        VECTOR_TARGET_DIMENSION_KEY, num_vector_targets
+    )
+    dataset_object.createDimension(EXAMPLE_ID_CHAR_DIM_KEY, num_id_characters)
+
+    if num_scalar_targets > 0:
+        dataset_object.createDimension(
+            SCALAR_TARGET_DIMENSION_KEY, num_scalar_targets
+        )
+
+    dataset_object.createVariable(
+        EXAMPLE_IDS_KEY, datatype='S1',
+        dimensions=(EXAMPLE_DIMENSION_KEY, EXAMPLE_ID_CHAR_DIM_KEY),
+        zlib=True, complevel=1,
+        chunksizes=(MAX_EXAMPLES_PER_VECTOR_CHUNK, num_id_characters),
+        fill_value=False
+    )
+
+    dataset_object.createVariable(
+        HEIGHTS_KEY, datatype=numpy.float32, dimensions=HEIGHT_DIMENSION_KEY,
+        contiguous=True, fill_value=False
+    )
+    dataset_object.variables[HEIGHTS_KEY][:] = heights_m_agl
+
+    if num_scalar_targets > 0:
+        for this_key in [SCALAR_TARGETS_KEY, SCALAR_PREDICTIONS_KEY]:
+            dataset_object.createVariable(
+                this_key, datatype=numpy.float32,
+                dimensions=
+                (EXAMPLE_DIMENSION_KEY, SCALAR_TARGET_DIMENSION_KEY),
+                zlib=True, complevel=1, shuffle=True,
+                chunksizes=
+                (MAX_EXAMPLES_PER_SCALAR_CHUNK, num_scalar_targets),
+                fill_value=False
+            )
+
+    for this_key in [VECTOR_TARGETS_KEY, VECTOR_PREDICTIONS_KEY]:
+        dataset_object.createVariable(
+            this_key, datatype=numpy.float32,
+            dimensions=(
+                EXAMPLE_DIMENSION_KEY, HEIGHT_DIMENSION_KEY,
+                VECTOR_TARGET_DIMENSION_KEY
+            ),
+            zlib=True, complevel=1, shuffle=True,
+            chunksizes=(MAX_EXAMPLES_PER_VECTOR_CHUNK, num_heights, 1),
+            fill_value=False
+        )
+
+    return dataset_object
+
+
+def append_to_file(
+        dataset_object, scalar_target_matrix, vector_target_matrix,
+        scalar_prediction_matrix, vector_prediction_matrix,
+        example_id_strings):
+    """Appends one batch of predictions to file.
+
+    :param dataset_object: Handle created by `open_appendable_file`.
+    :param scalar_target_matrix: See doc for `write_file`.
+    :param vector_target_matrix: Same.
+    :param scalar_prediction_matrix: Same.
+    :param vector_prediction_matrix: Same.
+    :param example_id_strings: Same.
+    :raises: ValueError: if any example ID is longer than the file's
+        example-ID width.
+    """
+
+    num_examples_before = dataset_object.variables[VECTOR_TARGETS_KEY].shape[0]
+    num_new_examples = vector_target_matrix.shape[0]
+    example_indices = slice(
+        num_examples_before, num_examples_before + num_new_examples
+    )
+
+    example_id_array = numpy.asarray(example_id_strings, dtype=numpy.str_)
+    num_id_characters = dataset_object.dimensions[EXAMPLE_ID_CHAR_DIM_KEY].size
+
+    if num_new_examples > 0:
+        this_max_length = int(numpy.char.str_len(example_id_array).max())
+
+        if this_max_length > num_id_characters:
+            error_string = (
+                'Example IDs have up to {0:d} characters, but file allows only'
+                ' {1:d} (set num_id_characters in `open_appendable_file`).'
+            ).format(this_max_length, num_id_characters)
+
+            raise ValueError(error_string)
+
+    example_ids_char_array = example_id_array.astype(
+        'S{0:d}'.format(num_id_characters)
+    ).view('S1').reshape(num_new_examples, num_id_characters)
+
+    dataset_object.variables[EXAMPLE_IDS_KEY][example_indices, :] = (
+        example_ids_char_array
+    )
+    dataset_object.variables[VECTOR_TARGETS_KEY][example_indices, ...] = (
+        _as_float32(vector_target_matrix)
+    )
+    dataset_object.variables[VECTOR_PREDICTIONS_KEY][example_indices, ...] = (
+        _as_float32(vector_prediction_matrix)
+    )
+
+    if SCALAR_TARGETS_KEY in dataset_object.variables:
+        dataset_object.variables[SCALAR_TARGETS_KEY][example_indices, :] = (
+            _as_float32(scalar_target_matrix)
+        )
+        dataset_object.variables[SCALAR_PREDICTIONS_KEY][
+            example_indices, :
+        ] = _as_float32(scalar_prediction_matrix)
+
+
+def close_appendable_file(dataset_object):
+    """Closes file opened by `open_appendable_file`.
+
+    :param dataset_object: Handle created by `open_appendable_file`.
+    """
+
+    dataset_object.close()
+    _list_directory.cache_clear()
 
 
 def read_file(netcdf_file_name):
@@ -358,15 +683,22 @@ def read_file(netcdf_file_name):
     """
 
     dataset_object = netCDF4.Dataset(netcdf_file_name)
+    dataset_object.set_auto_mask(False)
+    dataset_object.set_auto_scale(False)
+
+    example_ids_char_array = numpy.asarray(
+        dataset_object.variables[EXAMPLE_IDS_KEY][:]
+    )
+    example_id_bytes_array = example_ids_char_array.view(
+        'S{0:d}'.format(example_ids_char_array.shape[1])
+    ).reshape(-1)
 
     prediction_dict = {
         VECTOR_TARGETS_KEY: dataset_object.variables[VECTOR_TARGETS_KEY][:],
         VECTOR_PREDICTIONS_KEY:
             dataset_object.variables[VECTOR_PREDICTIONS_KEY][:],
-        EXAMPLE_IDS_KEY: [
-            str(id) for id in
-            netCDF4.chartostring(dataset_object.variables[EXAMPLE_IDS_KEY][:])
-        ],
+        EXAMPLE_IDS_KEY:
+            numpy.char.decode(example_id_bytes_array, 'ascii').tolist(),
         MODEL_FILE_KEY: str(getattr(dataset_object, MODEL_FILE_KEY))
     }
 
@@ -606,6 +938,49 @@ def average_predictions(
     }
 
 
+def _apply_selection(prediction_dict, desired_flags):
+    """Subsets examples by Boolean mask, choosing the cheaper indexing mode.
+
+    When most examples are kept, Boolean-mask indexing avoids building an
+    index array; when few are kept, `numpy.take` on the non-zero indices avoids
+    re-scanning the full mask for every per-example variable.
+
+    :param prediction_dict: See doc for `write_file`.
+    :param desired_flags: 1-D numpy array of Boolean flags, one per example.
+    :return: prediction_dict: Same as input but with fewer examples.
+    """
+
+    num_examples = len(desired_flags)
+    num_desired_examples = int(desired_flags.sum())
+    use_mask = num_desired_examples > num_examples // 2
+
+    if not use_mask:
+        desired_indices = numpy.flatnonzero(desired_flags)
+
+    for this_key in ONE_PER_EXAMPLE_KEYS:
+        if isinstance(prediction_dict[this_key], list):
+            this_array = numpy.asarray(prediction_dict[this_key], dtype=object)
+
+            if use_mask:
+                prediction_dict[this_key] = this_array[desired_flags].tolist()
+            else:
+                prediction_dict[this_key] = (
+                    this_array.take(desired_indices).tolist()
+                )
+        else:
+            if use_mask:
+                prediction_dict[this_key] = (
+                    prediction_dict[this_key][desired_flags, ...]
+                )
+            else:
+                prediction_dict[this_key] = (
+                    prediction_dict[this_key].take(desired_indices, axis=0)
+                )
+
+    prediction_dict.pop(_PARSED_IDS_KEY, None)
+    return prediction_dict
+
+
 def subset_by_standard_atmo(prediction_dict, standard_atmo_enum):
     """Subsets examples by standard-atmosphere type.
 
@@ -617,15 +992,13 @@ def subset_by_standard_atmo(prediction_dict, standard_atmo_enum):
 
     example_utils.check_standard_atmo_type(standard_atmo_enum)
 
-    all_standard_atmo_enums = example_utils.parse_example_ids(
-        prediction_dict[EXAMPLE_IDS_KEY]
+    all_standard_atmo_enums = _parse_example_ids_cached(
+        prediction_dict
     )[example_utils.STANDARD_ATMO_FLAGS_KEY]
 
-    desired_indices = numpy.where(
-        all_standard_atmo_enums == standard_atmo_enum
-    )[0]
-    return subset_by_index(
-        prediction_dict=prediction_dict, desired_indices=desired_indices
+    return _apply_selection(
+        prediction_dict=prediction_dict,
+        desired_flags=all_standard_atmo_enums == standard_atmo_enum
     )
 
 
@@ -651,20 +1024,25 @@ def subset_by_zenith_angle(
 
     error_checking.assert_is_boolean(max_inclusive)
 
-    all_zenith_angles_rad = example_utils.parse_example_ids(
-        prediction_dict[EXAMPLE_IDS_KEY]
+    all_zenith_angles_rad = _parse_example_ids_cached(
+        prediction_dict
     )[example_utils.ZENITH_ANGLES_KEY]
 
-    min_flags = all_zenith_angles_rad >= min_zenith_angle_rad
+    desired_flags = all_zenith_angles_rad >= min_zenith_angle_rad
 
     if max_inclusive:
-        max_flags = all_zenith_angles_rad <= max_zenith_angle_rad
+        numpy.logical_and(
+            desired_flags, all_zenith_angles_rad <= max_zenith_angle_rad,
+            out=desired_flags
+        )
     else:
-        max_flags = all_zenith_angles_rad < max_zenith_angle_rad
+        numpy.logical_and(
+            desired_flags, all_zenith_angles_rad < max_zenith_angle_rad,
+            out=desired_flags
+        )
 
-    desired_indices = numpy.where(numpy.logical_and(min_flags, max_flags))[0]
-    return subset_by_index(
-        prediction_dict=prediction_dict, desired_indices=desired_indices
+    return _apply_selection(
+        prediction_dict=prediction_dict, desired_flags=desired_flags
     )
 
 
@@ -689,8 +1067,8 @@ def subset_by_albedo(
 
     error_checking.assert_is_boolean(max_inclusive)
 
-    all_albedos = example_utils.parse_example_ids(
-        prediction_dict[EXAMPLE_IDS_KEY]
+    all_albedos = _parse_example_ids_cached(
+        prediction_dict
     )[example_utils.ALBEDOS_KEY]
 
     min_flags = all_albedos >= min_albedo
@@ -700,9 +1078,9 @@ def subset_by_albedo(
     else:
         max_flags = all_albedos < max_albedo
 
-    desired_indices = numpy.where(numpy.logical_and(min_flags, max_flags))[0]
-    return subset_by_index(
-        prediction_dict=prediction_dict, desired_indices=desired_indices
+    return _apply_selection(
+        prediction_dict=prediction_dict,
+        desired_flags=numpy.logical_and(min_flags, max_flags, out=min_flags)
     )
 
 
@@ -718,18 +1096,20 @@ def subset_by_month(prediction_dict, desired_month):
     error_checking.assert_is_geq(desired_month, 1)
     error_checking.assert_is_leq(desired_month, 12)
 
-    all_times_unix_sec = example_utils.parse_example_ids(
-        prediction_dict[EXAMPLE_IDS_KEY]
+    all_times_unix_sec = _parse_example_ids_cached(
+        prediction_dict
     )[example_utils.VALID_TIMES_KEY]
 
-    all_months = numpy.array([
-        int(time_conversion.unix_sec_to_string(t, '%m'))
-        for t in all_times_unix_sec
-    ], dtype=int)
+    all_months = 1 + numpy.mod(
+        all_times_unix_sec.astype('datetime64[s]').astype(
+            'datetime64[M]'
+        ).astype(int),
+        12
+    )
 
-    desired_indices = numpy.where(all_months == desired_month)[0]
-    return subset_by_index(
-        prediction_dict=prediction_dict, desired_indices=desired_indices
+    return _apply_selection(
+        prediction_dict=prediction_dict,
+        desired_flags=all_months == desired_month
     )
 
 
@@ -750,14 +1130,15 @@ def subset_by_index(prediction_dict, desired_indices):
 
     for this_key in ONE_PER_EXAMPLE_KEYS:
         if isinstance(prediction_dict[this_key], list):
-            prediction_dict[this_key] = [
-                prediction_dict[this_key][k] for k in desired_indices
-            ]
+            prediction_dict[this_key] = numpy.asarray(
+                prediction_dict[this_key], dtype=object
+            )[desired_indices].tolist()
         else:
             prediction_dict[this_key] = (
                 prediction_dict[this_key][desired_indices, ...]
             )
 
+    prediction_dict.pop(_PARSED_IDS_KEY, None)
     return prediction_dict
 
 
@@ -772,12 +1153,18 @@ def concat_predictions(prediction_dicts):
         different models.
     """
 
-    prediction_dict = copy.deepcopy(prediction_dicts[0])
-    keys_to_match = [MODEL_FILE_KEY, ISOTONIC_MODEL_FILE_KEY, HEIGHTS_KEY]
+    reference_heights_m_agl = prediction_dicts[0][HEIGHTS_KEY]
+    reference_file_names = {
+        MODEL_FILE_KEY: prediction_dicts[0][MODEL_FILE_KEY],
+        ISOTONIC_MODEL_FILE_KEY: prediction_dicts[0][ISOTONIC_MODEL_FILE_KEY]
+    }
+
+    prediction_dict = {HEIGHTS_KEY: reference_heights_m_agl}
+    prediction_dict.update(reference_file_names)
 
     for i in range(1, len(prediction_dicts)):
         if not numpy.allclose(
-                prediction_dict[HEIGHTS_KEY], prediction_dicts[i][HEIGHTS_KEY],
+                reference_heights_m_agl, prediction_dicts[i][HEIGHTS_KEY],
                 atol=TOLERANCE
         ):
             error_string = (
@@ -785,17 +1172,14 @@ def concat_predictions(prediction_dicts):
                 '(units are m AGL).  1st dictionary:\n{1:s}\n\n'
                 '{0:d}th dictionary:\n{2:s}'
             ).format(
-                i + 1, str(prediction_dict[HEIGHTS_KEY]),
+                i + 1, str(reference_heights_m_agl),
                 str(prediction_dicts[i][HEIGHTS_KEY])
             )
 
             raise ValueError(error_string)
 
-        for this_key in keys_to_match:
-            if this_key == HEIGHTS_KEY:
-                continue
-
-            if prediction_dict[this_key] == prediction_dicts[i][this_key]:
+        for this_key in reference_file_names:
+            if prediction_dicts[i][this_key] == reference_file_names[this_key]:
                 continue
 
             error_string = (
@@ -803,18 +1187,20 @@ def concat_predictions(prediction_dicts):
                 '"{1:s}".  1st dictionary:\n{2:s}\n\n'
                 '{0:d}th dictionary:\n{3:s}'
             ).format(
-                i + 1, this_key, str(prediction_dict[this_key]),
+                i + 1, this_key, str(reference_file_names[this_key]),
                 str(prediction_dicts[i][this_key])
             )
 
             raise ValueError(error_string)
 
-        for this_key in ONE_PER_EXAMPLE_KEYS:
-            if isinstance(prediction_dict[this_key], list):
-                prediction_dict[this_key] += prediction_dicts[i][this_key]
-            else:
-                prediction_dict[this_key] = numpy.concatenate((
-                    prediction_dict[this_key], prediction_dicts[i][this_key]
-                ), axis=0)
+    for this_key in ONE_PER_EXAMPLE_KEYS:
+        if isinstance(prediction_dicts[0][this_key], list):
+            prediction_dict[this_key] = list(itertools.chain.from_iterable(
+                d[this_key] for d in prediction_dicts
+            ))
+        else:
+            prediction_dict[this_key] = numpy.concatenate(
+                [d[this_key] for d in prediction_dicts], axis=0
+            )
 
     return prediction_dict
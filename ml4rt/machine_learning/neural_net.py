@@ -1,8 +1,11 @@
 """Methods for building, training, and applying neural nets."""
 
 import copy
+import queue
 import random
 import os.path
+import threading
+import concurrent.futures
 import dill
 import numpy
 import keras
@@ -18,6 +21,7 @@ from ml4rt.machine_learning import keras_metrics as custom_metrics
 from ml4rt.machine_learning import keras_losses as custom_losses
 
 SENTINEL_VALUE = -9999.
+NUM_FILE_READ_WORKERS = 4
 
 LARGE_INTEGER = int(1e12)
 LARGE_FLOAT = 1e12
@@ -317,6 +321,54 @@ def _read_file_for_generator(
     return example_dict
 
 
+def _read_many_files_for_generator(example_file_names, **read_kwargs):
+    """Reads many files for generator, overlapping the file reads.
+
+    netCDF4 releases the GIL during I/O, so reading several files from a
+    thread pool overlaps their disk latency.  Dictionaries are yielded in the
+    same order as `example_file_names`, and at most `NUM_FILE_READ_WORKERS`
+    files are held in memory at once, so a caller that discards each
+    dictionary after use keeps peak memory bounded no matter how many files
+    are read.
+
+    :param example_file_names: 1-D list of paths to input files.
+    :param read_kwargs: Keyword arguments for `_read_file_for_generator`
+        (everything except `example_file_name`).
+    :return: example_dict: Dictionary in format returned by
+        `_read_file_for_generator`, yielded once per input file.
+    """
+
+    num_files = len(example_file_names)
+
+    if num_files < 2:
+        for this_file_name in example_file_names:
+            yield _read_file_for_generator(
+                example_file_name=this_file_name, **read_kwargs
+            )
+
+        return
+
+    num_workers = min([NUM_FILE_READ_WORKERS, num_files])
+
+    with concurrent.futures.ThreadPoolExecutor(num_workers) as executor_object:
+        pending_futures = []
+        next_file_index = 0
+
+        while len(pending_futures) > 0 or next_file_index < num_files:
+            while (
+                    next_file_index < num_files and
+                    len(pending_futures) < num_workers
+            ):
+                pending_futures.append(executor_object.submit(
+                    _read_file_for_generator,
+                    example_file_name=example_file_names[next_file_index],
+                    **read_kwargs
+                ))
+                next_file_index += 1
+
+            yield pending_futures.pop(0).result()
+
+
 def _read_specific_examples(
         example_file_names, example_id_strings, field_names, heights_m_agl,
         training_example_dict, predictor_norm_type_string,
@@ -352,19 +404,19 @@ def _read_specific_examples(
         example_id_strings
     )[example_utils.VALID_TIMES_KEY]
 
-    example_years = numpy.array([
-        int(time_conversion.unix_sec_to_string(t, '%Y'))
-        for t in example_times_unix_sec
-    ], dtype=int)
+    example_years = 1970 + example_times_unix_sec.astype(
+        'datetime64[s]'
+    ).astype('datetime64[Y]').astype(int)
 
+    example_id_array = numpy.asarray(example_id_strings, dtype=object)
     unique_example_years = numpy.unique(example_years)
     example_dicts = []
 
     for this_year in unique_example_years:
         these_indices = numpy.where(example_years == this_year)[0]
-        these_example_id_strings = [
-            example_id_strings[k] for k in these_indices
-        ]
+        these_example_id_strings = (
+            example_id_array[these_indices].tolist()
+        )
         this_file_index = numpy.where(file_years == this_year)[0][0]
 
         print('\nReading data from: "{0:s}"...'.format(
@@ -653,7 +705,7 @@ def predictors_numpy_to_dict(predictor_matrix, example_dict, net_type_string):
 
         if num_scalar_predictors == 0:
             scalar_predictor_matrix = predictor_matrix[:, :0]
-            vector_predictor_matrix = predictor_matrix + 0.
+            vector_predictor_matrix = predictor_matrix.copy()
         else:
             scalar_predictor_matrix = (
                 predictor_matrix[:, -num_scalar_predictors:]
@@ -683,7 +735,7 @@ def predictors_numpy_to_dict(predictor_matrix, example_dict, net_type_string):
 
     if num_scalar_predictors == 0:
         scalar_predictor_matrix = predictor_matrix[:, 0, :0]
-        vector_predictor_matrix = predictor_matrix + 0.
+        vector_predictor_matrix = predictor_matrix.copy()
     else:
         scalar_predictor_matrix = (
             predictor_matrix[:, 0, -num_scalar_predictors:]
@@ -810,7 +862,7 @@ def targets_numpy_to_dict(target_matrices, example_dict, net_type_string):
 
         if num_scalar_targets == 0:
             scalar_target_matrix = target_matrix[:, :0]
-            vector_target_matrix = target_matrix + 0.
+            vector_target_matrix = target_matrix.copy()
         else:
             scalar_target_matrix = target_matrix[:, -num_scalar_targets:]
             vector_target_matrix = target_matrix[:, :-num_scalar_targets]
@@ -1052,6 +1104,55 @@ def target_var_to_neuron_indices(example_dict, net_type_string, target_name,
     return numpy.array([height_indices[0], field_indices[0]], dtype=int)
 
 
+class _BackgroundGenerator(object):
+    """Runs a generator in a background thread.
+
+    Batches are produced into a bounded queue while the consumer (usually
+    Keras) is busy with the previous batch, so file reads and normalization
+    overlap with training or inference instead of serializing with it.
+    """
+
+    _END_OF_GENERATOR = object()
+
+    def __init__(self, generator, max_queue_size=2):
+        """Creates new background generator.
+
+        :param generator: Generator to run in background thread.
+        :param max_queue_size: Max number of batches to produce ahead of the
+            consumer.
+        """
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._generator = generator
+
+        self._thread = threading.Thread(target=self._fill_queue)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _fill_queue(self):
+        """Feeds batches from the wrapped generator into the queue."""
+
+        try:
+            for this_batch in self._generator:
+                self._queue.put(this_batch)
+            self._queue.put(self._END_OF_GENERATOR)
+        except BaseException as this_exception:
+            self._queue.put(this_exception)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        this_item = self._queue.get()
+
+        if this_item is self._END_OF_GENERATOR:
+            raise StopIteration
+        if isinstance(this_item, BaseException):
+            raise this_item
+
+        return this_item
+
+
 def data_generator(option_dict, for_inference, net_type_string,
                    is_loss_constrained_mse=None):
     """Generates training data for any kind of neural net.
@@ -1187,11 +1288,13 @@ def data_generator(option_dict, for_inference, net_type_string,
         raise_error_if_any_missing=False
     )
 
+    # Each dictionary is discarded as soon as its example IDs are harvested,
+    # so peak memory stays bounded by the read window even for multi-year
+    # training periods.
     all_desired_id_strings = []
 
-    for this_file_name in example_file_names:
-        this_example_dict = _read_file_for_generator(
-            example_file_name=this_file_name,
+    for this_example_dict in _read_many_files_for_generator(
+            example_file_names=example_file_names,
             first_time_unix_sec=first_time_unix_sec,
             last_time_unix_sec=last_time_unix_sec,
             field_names=all_field_names, heights_m_agl=heights_m_agl,
@@ -1207,8 +1310,7 @@ def data_generator(option_dict, for_inference, net_type_string,
             scalar_target_norm_type_string=scalar_target_norm_type_string,
             scalar_target_min_norm_value=scalar_target_min_norm_value,
             scalar_target_max_norm_value=scalar_target_max_norm_value
-        )
-
+    ):
         these_id_strings = this_example_dict[example_utils.EXAMPLE_IDS_KEY]
         random.shuffle(these_id_strings)
         all_desired_id_strings += these_id_strings
@@ -1220,16 +1322,16 @@ def data_generator(option_dict, for_inference, net_type_string,
             raise StopIteration
 
         num_examples_in_memory = 0
-        predictor_matrix = None
-        target_matrix = None
-        vector_target_matrix = None
-        scalar_target_matrix = None
+        predictor_matrices = []
+        target_matrices = []
+        vector_target_matrices = []
+        scalar_target_matrices = []
         example_id_strings = []
 
         while num_examples_in_memory < num_examples_per_batch:
             if example_index == len(all_desired_id_strings):
                 if for_inference:
-                    if predictor_matrix is None:
+                    if len(predictor_matrices) == 0:
                         raise StopIteration
 
                     break
@@ -1280,46 +1382,40 @@ def data_generator(option_dict, for_inference, net_type_string,
                 else:
                     this_scalar_target_matrix = this_target_list[1]
 
-            if predictor_matrix is None:
-                predictor_matrix = this_predictor_matrix + 0.
+            # Accumulating in a list and concatenating once per batch avoids
+            # re-copying the whole accumulator for every file read.  Chunks
+            # are cast to float32 up front, so the concatenation moves half
+            # the bytes that float64 would.
+            predictor_matrices.append(
+                this_predictor_matrix.astype('float32', copy=False)
+            )
 
-                if this_target_matrix is not None:
-                    target_matrix = this_target_matrix + 0.
-                if this_vector_target_matrix is not None:
-                    vector_target_matrix = this_vector_target_matrix + 0.
-                if this_scalar_target_matrix is not None:
-                    scalar_target_matrix = this_scalar_target_matrix + 0.
-            else:
-                predictor_matrix = numpy.concatenate(
-                    (predictor_matrix, this_predictor_matrix), axis=0
+            if this_target_matrix is not None:
+                target_matrices.append(
+                    this_target_matrix.astype('float32', copy=False)
+                )
+            if this_vector_target_matrix is not None:
+                vector_target_matrices.append(
+                    this_vector_target_matrix.astype('float32', copy=False)
+                )
+            if this_scalar_target_matrix is not None:
+                scalar_target_matrices.append(
+                    this_scalar_target_matrix.astype('float32', copy=False)
                 )
 
-                if this_target_matrix is not None:
-                    target_matrix = numpy.concatenate(
-                        (target_matrix, this_target_matrix), axis=0
-                    )
-                if this_vector_target_matrix is not None:
-                    vector_target_matrix = numpy.concatenate(
-                        (vector_target_matrix, this_vector_target_matrix),
-                        axis=0
-                    )
-                if this_scalar_target_matrix is not None:
-                    scalar_target_matrix = numpy.concatenate(
-                        (scalar_target_matrix, this_scalar_target_matrix),
-                        axis=0
-                    )
-
-            num_examples_in_memory = predictor_matrix.shape[0]
+            num_examples_in_memory += this_predictor_matrix.shape[0]
 
-        predictor_matrix = predictor_matrix.astype('float32')
+        predictor_matrix = numpy.concatenate(predictor_matrices, axis=0)
 
         if net_type_string == DENSE_NET_TYPE_STRING:
-            target_array = target_matrix.astype('float32')
+            target_array = numpy.concatenate(target_matrices, axis=0)
         else:
-            target_array = [vector_target_matrix.astype('float32')]
+            target_array = [numpy.concatenate(vector_target_matrices, axis=0)]
 
-            if scalar_target_matrix is not None:
-                target_array.append(scalar_target_matrix.astype('float32'))
+            if len(scalar_target_matrices) > 0:
+                target_array.append(
+                    numpy.concatenate(scalar_target_matrices, axis=0)
+                )
 
         if for_inference:
             yield predictor_matrix, target_array, example_id_strings
@@ -1404,30 +1500,25 @@ def create_data(option_dict, for_inference, net_type_string,
         raise_error_if_any_missing=False
     )
 
-    example_dicts = []
-
-    for this_file_name in example_file_names:
-        this_example_dict = _read_file_for_generator(
-            example_file_name=this_file_name,
-            first_time_unix_sec=first_time_unix_sec,
-            last_time_unix_sec=last_time_unix_sec,
-            field_names=all_field_names, heights_m_agl=heights_m_agl,
-            min_column_lwp_kg_m02=min_column_lwp_kg_m02,
-            max_column_lwp_kg_m02=max_column_lwp_kg_m02,
-            training_example_dict=training_example_dict,
-            predictor_norm_type_string=predictor_norm_type_string,
-            predictor_min_norm_value=predictor_min_norm_value,
-            predictor_max_norm_value=predictor_max_norm_value,
-            vector_target_norm_type_string=vector_target_norm_type_string,
-            vector_target_min_norm_value=vector_target_min_norm_value,
-            vector_target_max_norm_value=vector_target_max_norm_value,
-            scalar_target_norm_type_string=scalar_target_norm_type_string,
-            scalar_target_min_norm_value=scalar_target_min_norm_value,
-            scalar_target_max_norm_value=scalar_target_max_norm_value,
-            exclude_summit_greenland=exclude_summit_greenland
-        )
-
-        example_dicts.append(this_example_dict)
+    example_dicts = list(_read_many_files_for_generator(
+        example_file_names=example_file_names,
+        first_time_unix_sec=first_time_unix_sec,
+        last_time_unix_sec=last_time_unix_sec,
+        field_names=all_field_names, heights_m_agl=heights_m_agl,
+        min_column_lwp_kg_m02=min_column_lwp_kg_m02,
+        max_column_lwp_kg_m02=max_column_lwp_kg_m02,
+        training_example_dict=training_example_dict,
+        predictor_norm_type_string=predictor_norm_type_string,
+        predictor_min_norm_value=predictor_min_norm_value,
+        predictor_max_norm_value=predictor_max_norm_value,
+        vector_target_norm_type_string=vector_target_norm_type_string,
+        vector_target_min_norm_value=vector_target_min_norm_value,
+        vector_target_max_norm_value=vector_target_max_norm_value,
+        scalar_target_norm_type_string=scalar_target_norm_type_string,
+        scalar_target_min_norm_value=scalar_target_min_norm_value,
+        scalar_target_max_norm_value=scalar_target_max_norm_value,
+        exclude_summit_greenland=exclude_summit_greenland
+    ))
 
     example_dict = example_utils.concat_examples(example_dicts)
 
@@ -1538,14 +1629,14 @@ def data_generator_specific_examples(option_dict, net_type_string,
             raise StopIteration
 
         num_examples_in_memory = 0
-        predictor_matrix = None
-        target_matrix = None
-        vector_target_matrix = None
-        scalar_target_matrix = None
+        predictor_matrices = []
+        target_matrices = []
+        vector_target_matrices = []
+        scalar_target_matrices = []
 
         while num_examples_in_memory < num_examples_per_batch:
             if example_index >= len(example_id_strings):
-                if predictor_matrix is None:
+                if len(predictor_matrices) == 0:
                     raise StopIteration
 
                 break
@@ -1594,46 +1685,40 @@ def data_generator_specific_examples(option_dict, net_type_string,
                 else:
                     this_scalar_target_matrix = this_target_list[1]
 
-            if predictor_matrix is None:
-                predictor_matrix = this_predictor_matrix + 0.
+            # Accumulating in a list and concatenating once per batch avoids
+            # re-copying the whole accumulator for every file read.  Chunks
+            # are cast to float32 up front, so the concatenation moves half
+            # the bytes that float64 would.
+            predictor_matrices.append(
+                this_predictor_matrix.astype('float32', copy=False)
+            )
 
-                if this_target_matrix is not None:
-                    target_matrix = this_target_matrix + 0.
-                if this_vector_target_matrix is not None:
-                    vector_target_matrix = this_vector_target_matrix + 0.
-                if this_scalar_target_matrix is not None:
-                    scalar_target_matrix = this_scalar_target_matrix + 0.
-            else:
-                predictor_matrix = numpy.concatenate(
-                    (predictor_matrix, this_predictor_matrix), axis=0
+            if this_target_matrix is not None:
+                target_matrices.append(
+                    this_target_matrix.astype('float32', copy=False)
+                )
+            if this_vector_target_matrix is not None:
+                vector_target_matrices.append(
+                    this_vector_target_matrix.astype('float32', copy=False)
+                )
+            if this_scalar_target_matrix is not None:
+                scalar_target_matrices.append(
+                    this_scalar_target_matrix.astype('float32', copy=False)
                 )
 
-                if this_target_matrix is not None:
-                    target_matrix = numpy.concatenate(
-                        (target_matrix, this_target_matrix), axis=0
-                    )
-                if this_vector_target_matrix is not None:
-                    vector_target_matrix = numpy.concatenate(
-                        (vector_target_matrix, this_vector_target_matrix),
-                        axis=0
-                    )
-                if this_scalar_target_matrix is not None:
-                    scalar_target_matrix = numpy.concatenate(
-                        (scalar_target_matrix, this_scalar_target_matrix),
-                        axis=0
-                    )
-
-            num_examples_in_memory = predictor_matrix.shape[0]
+            num_examples_in_memory += this_predictor_matrix.shape[0]
 
-        predictor_matrix = predictor_matrix.astype('float32')
+        predictor_matrix = numpy.concatenate(predictor_matrices, axis=0)
 
         if net_type_string == DENSE_NET_TYPE_STRING:
-            target_array = target_matrix.astype('float32')
+            target_array = numpy.concatenate(target_matrices, axis=0)
         else:
-            target_array = [vector_target_matrix.astype('float32')]
+            target_array = [numpy.concatenate(vector_target_matrices, axis=0)]
 
-            if scalar_target_matrix is not None:
-                target_array.append(scalar_target_matrix.astype('float32'))
+            if len(scalar_target_matrices) > 0:
+                target_array.append(
+                    numpy.concatenate(scalar_target_matrices, axis=0)
+                )
 
         yield predictor_matrix, target_array
 
@@ -1869,18 +1954,18 @@ def train_model_with_generator(
         loss_function_or_dict
     )
 
-    training_generator = data_generator(
+    training_generator = _BackgroundGenerator(data_generator(
         option_dict=training_option_dict, for_inference=False,
         net_type_string=net_type_string,
         is_loss_constrained_mse=is_loss_constrained_mse
-    )
+    ))
 
     if use_generator_for_validn:
-        validation_generator = data_generator(
+        validation_generator = _BackgroundGenerator(data_generator(
             option_dict=validation_option_dict, for_inference=False,
             net_type_string=net_type_string,
             is_loss_constrained_mse=is_loss_constrained_mse
-        )
+        ))
 
         validation_data_arg = validation_generator
         validation_steps_arg = num_validation_batches_per_epoch
@@ -2245,7 +2330,7 @@ def apply_model(
 
         if net_type_string == DENSE_NET_TYPE_STRING:
             if prediction_matrix is None:
-                prediction_matrix = this_output + 0.
+                prediction_matrix = this_output.copy()
             else:
                 prediction_matrix = numpy.concatenate(
                     (prediction_matrix, this_output), axis=0
@@ -2255,10 +2340,10 @@ def apply_model(
                 this_output = [this_output]
 
             if vector_prediction_matrix is None:
-                vector_prediction_matrix = this_output[0] + 0.
+                vector_prediction_matrix = this_output[0].copy()
 
                 if len(this_output) == 2:
-                    scalar_prediction_matrix = this_output[1] + 0.
+                    scalar_prediction_matrix = this_output[1].copy()
             else:
                 vector_prediction_matrix = numpy.concatenate(
                     (vector_prediction_matrix, this_output[0]), axis=0
@@ -2336,7 +2421,7 @@ def get_feature_maps(
         )
 
         if feature_matrix is None:
-            feature_matrix = this_feature_matrix + 0.
+            feature_matrix = this_feature_matrix.copy()
         else:
             feature_matrix = numpy.concatenate(
                 (feature_matrix, this_feature_matrix), axis=0
@@ -1,9 +1,12 @@
 """Plotting methods for model evaluation."""
 
+import copy
+import functools
+import numba
 import numpy
 import matplotlib
-matplotlib.use('agg')
 import matplotlib.colors
+import matplotlib.lines
 import matplotlib.patches
 from matplotlib import pyplot
 from gewittergefahr.gg_utils import error_checking
@@ -54,13 +57,29 @@ TAYLOR_PREDICTION_MARKER_SIZE = 20
 DEFAULT_HEIGHT_CMAP_OBJECT = pyplot.get_cmap('viridis')
 
 FONT_SIZE = 36
-pyplot.rc('font', size=FONT_SIZE)
-pyplot.rc('axes', titlesize=FONT_SIZE)
-pyplot.rc('axes', labelsize=FONT_SIZE)
-pyplot.rc('xtick', labelsize=FONT_SIZE)
-pyplot.rc('ytick', labelsize=FONT_SIZE)
-pyplot.rc('legend', fontsize=FONT_SIZE)
-pyplot.rc('figure', titlesize=FONT_SIZE)
+
+_DEFAULT_FONT_SIZES_APPLIED = False
+
+
+def _apply_default_font_sizes():
+    """Applies default font sizes to matplotlib (once per process)."""
+
+    global _DEFAULT_FONT_SIZES_APPLIED
+    if _DEFAULT_FONT_SIZES_APPLIED:
+        return
+
+    _DEFAULT_FONT_SIZES_APPLIED = True
+
+    pyplot.rc('font', size=FONT_SIZE)
+    pyplot.rc('axes', titlesize=FONT_SIZE)
+    pyplot.rc('axes', labelsize=FONT_SIZE)
+    pyplot.rc('xtick', labelsize=FONT_SIZE)
+    pyplot.rc('ytick', labelsize=FONT_SIZE)
+    pyplot.rc('legend', fontsize=FONT_SIZE)
+    pyplot.rc('figure', titlesize=FONT_SIZE)
+
+
+_apply_default_font_sizes()
 
 
 def _check_score_name(score_name):
@@ -132,6 +151,7 @@ def _plot_reliability_curve(
     return main_line_handle
 
 
+@numba.njit(cache=True)
 def _get_positive_skill_area(mean_value_in_training, min_value_in_plot,
                              max_value_in_plot):
     """Returns positive-skill area (where BSS > 0) for attributes diagram.
@@ -147,28 +167,38 @@ def _get_positive_skill_area(mean_value_in_training, min_value_in_plot,
     :return: y_coords_right: Same but for y-coordinates.
     """
 
-    x_coords_left = numpy.array([
-        min_value_in_plot, mean_value_in_training, mean_value_in_training,
-        min_value_in_plot, min_value_in_plot
-    ])
-    y_coords_left = numpy.array([
-        min_value_in_plot, min_value_in_plot, mean_value_in_training,
-        (min_value_in_plot + mean_value_in_training) / 2, min_value_in_plot
-    ])
-
-    x_coords_right = numpy.array([
-        mean_value_in_training, max_value_in_plot, max_value_in_plot,
-        mean_value_in_training, mean_value_in_training
-    ])
-    y_coords_right = numpy.array([
-        mean_value_in_training,
-        (max_value_in_plot + mean_value_in_training) / 2,
-        max_value_in_plot, max_value_in_plot, mean_value_in_training
-    ])
+    x_coords_left = numpy.empty(5)
+    x_coords_left[0] = min_value_in_plot
+    x_coords_left[1] = mean_value_in_training
+    x_coords_left[2] = mean_value_in_training
+    x_coords_left[3] = min_value_in_plot
+    x_coords_left[4] = min_value_in_plot
+
+    y_coords_left = numpy.empty(5)
+    y_coords_left[0] = min_value_in_plot
+    y_coords_left[1] = min_value_in_plot
+    y_coords_left[2] = mean_value_in_training
+    y_coords_left[3] = (min_value_in_plot + mean_value_in_training) / 2
+    y_coords_left[4] = min_value_in_plot
+
+    x_coords_right = numpy.empty(5)
+    x_coords_right[0] = mean_value_in_training
+    x_coords_right[1] = max_value_in_plot
+    x_coords_right[2] = max_value_in_plot
+    x_coords_right[3] = mean_value_in_training
+    x_coords_right[4] = mean_value_in_training
+
+    y_coords_right = numpy.empty(5)
+    y_coords_right[0] = mean_value_in_training
+    y_coords_right[1] = (max_value_in_plot + mean_value_in_training) / 2
+    y_coords_right[2] = max_value_in_plot
+    y_coords_right[3] = max_value_in_plot
+    y_coords_right[4] = mean_value_in_training
 
     return x_coords_left, y_coords_left, x_coords_right, y_coords_right
 
 
+@numba.njit(cache=True)
 def _get_zero_skill_line(mean_value_in_training, min_value_in_plot,
                          max_value_in_plot):
     """Returns zero-skill line (where BSS = 0) for attributes diagram.
@@ -180,22 +210,33 @@ def _get_zero_skill_line(mean_value_in_training, min_value_in_plot,
     :return: y_coords: Same but for y-coordinates.
     """
 
-    x_coords = numpy.array([min_value_in_plot, max_value_in_plot], dtype=float)
+    x_coords = numpy.empty(2)
+    x_coords[0] = min_value_in_plot
+    x_coords[1] = max_value_in_plot
+
     y_coords = 0.5 * (mean_value_in_training + x_coords)
 
     return x_coords, y_coords
 
 
-def _plot_attr_diagram_background(
-        axes_object, mean_value_in_training, min_value_in_plot,
-        max_value_in_plot):
-    """Plots background (reference lines and polygons) of attributes diagram.
+@functools.lru_cache(maxsize=16)
+def _build_attr_background_artists(
+        mean_value_in_training, min_value_in_plot, max_value_in_plot):
+    """Builds background artists (reference lines and polygons) for attr diag.
+
+    The background geometry depends only on the input args, so the artists are
+    cached across calls.  This matters when plotting many attributes diagrams
+    (e.g., one per target variable) in the same run.  Callers must deep-copy
+    each artist before adding it to axes, since one matplotlib artist cannot
+    live on several axes.
 
-    :param axes_object: Will plot on these axes (instance of
-        `matplotlib.axes._subplots.AxesSubplot`).
     :param mean_value_in_training: Mean of target variable in training data.
     :param min_value_in_plot: Minimum value in plot (for both x- and y-axes).
     :param max_value_in_plot: Max value in plot (for both x- and y-axes).
+    :return: patch_objects: length-2 tuple of `matplotlib.patches.Polygon`
+        instances (positive-skill areas).
+    :return: line_objects: length-3 tuple of `matplotlib.lines.Line2D`
+        instances (zero-skill line and two climo lines).
     """
 
     x_coords_left, y_coords_left, x_coords_right, y_coords_right = (
@@ -217,7 +258,7 @@ def _plot_attr_diagram_background(
         left_polygon_coord_matrix, lw=0,
         ec=skill_area_colour, fc=skill_area_colour
     )
-    axes_object.add_patch(left_patch_object)
+    left_patch_object.set_rasterized(True)
 
     right_polygon_coord_matrix = numpy.transpose(numpy.vstack((
         x_coords_right, y_coords_right
@@ -226,7 +267,7 @@ def _plot_attr_diagram_background(
         right_polygon_coord_matrix, lw=0,
         ec=skill_area_colour, fc=skill_area_colour
     )
-    axes_object.add_patch(right_patch_object)
+    right_patch_object.set_rasterized(True)
 
     no_skill_x_coords, no_skill_y_coords = _get_zero_skill_line(
         mean_value_in_training=mean_value_in_training,
@@ -234,23 +275,56 @@ def _plot_attr_diagram_background(
         max_value_in_plot=max_value_in_plot
     )
 
-    axes_object.plot(
+    no_skill_line_object = matplotlib.lines.Line2D(
         no_skill_x_coords, no_skill_y_coords, color=ZERO_SKILL_LINE_COLOUR,
         linestyle='solid', linewidth=ZERO_SKILL_LINE_WIDTH
     )
 
     climo_x_coords = numpy.full(2, mean_value_in_training)
     climo_y_coords = numpy.array([min_value_in_plot, max_value_in_plot])
-    axes_object.plot(
+
+    vertical_climo_line_object = matplotlib.lines.Line2D(
         climo_x_coords, climo_y_coords, color=CLIMO_LINE_COLOUR,
         linestyle='dashed', linewidth=CLIMO_LINE_WIDTH
     )
-
-    axes_object.plot(
+    horizontal_climo_line_object = matplotlib.lines.Line2D(
         climo_y_coords, climo_x_coords, color=CLIMO_LINE_COLOUR,
         linestyle='dashed', linewidth=CLIMO_LINE_WIDTH
     )
 
+    patch_objects = (left_patch_object, right_patch_object)
+    line_objects = (
+        no_skill_line_object, vertical_climo_line_object,
+        horizontal_climo_line_object
+    )
+
+    return patch_objects, line_objects
+
+
+def _plot_attr_diagram_background(
+        axes_object, mean_value_in_training, min_value_in_plot,
+        max_value_in_plot):
+    """Plots background (reference lines and polygons) of attributes diagram.
+
+    :param axes_object: Will plot on these axes (instance of
+        `matplotlib.axes._subplots.AxesSubplot`).
+    :param mean_value_in_training: Mean of target variable in training data.
+    :param min_value_in_plot: Minimum value in plot (for both x- and y-axes).
+    :param max_value_in_plot: Max value in plot (for both x- and y-axes).
+    """
+
+    patch_objects, line_objects = _build_attr_background_artists(
+        mean_value_in_training=float(mean_value_in_training),
+        min_value_in_plot=float(min_value_in_plot),
+        max_value_in_plot=float(max_value_in_plot)
+    )
+
+    for this_patch_object in patch_objects:
+        axes_object.add_patch(copy.deepcopy(this_patch_object))
+
+    for this_line_object in line_objects:
+        axes_object.add_line(copy.deepcopy(this_line_object))
+
 
 def plot_inset_histogram(
         figure_object, bin_centers, bin_counts, has_predictions,
@@ -716,18 +790,37 @@ def plot_rel_curve_many_heights(
         similar).  Will be used to colour reliability curves by height.
     """
 
-    error_checking.assert_is_numpy_array(mean_target_matrix, num_dimensions=2)
-    error_checking.assert_is_numpy_array(
-        mean_prediction_matrix,
-        exact_dimensions=numpy.array(mean_target_matrix.shape, dtype=int)
-    )
+    mean_target_matrix = numpy.asarray(mean_target_matrix, dtype=numpy.float64)
+    mean_prediction_matrix = numpy.asarray(
+        mean_prediction_matrix, dtype=numpy.float64
+    )
+    heights_m_agl = numpy.asarray(heights_m_agl, dtype=numpy.float64)
+
+    if (
+            mean_target_matrix.ndim != 2 or
+            mean_prediction_matrix.shape != mean_target_matrix.shape
+    ):
+        error_string = (
+            'Mean-target matrix (shape {0:s}) should be 2-D with same shape '
+            'as mean-prediction matrix (shape {1:s}).'
+        ).format(
+            str(mean_target_matrix.shape), str(mean_prediction_matrix.shape)
+        )
+
+        raise ValueError(error_string)
 
     num_heights = mean_target_matrix.shape[0]
 
-    error_checking.assert_is_geq_numpy_array(heights_m_agl, 0.)
-    error_checking.assert_is_numpy_array(
-        heights_m_agl, exact_dimensions=numpy.array([num_heights], dtype=int)
-    )
+    if (
+            heights_m_agl.shape != (num_heights,) or
+            not (heights_m_agl >= 0).all()
+    ):
+        error_string = (
+            'Heights should be a length-{0:d} numpy array of non-negative '
+            'values.'
+        ).format(num_heights)
+
+        raise ValueError(error_string)
 
     error_checking.assert_is_greater(max_value_to_plot, min_value_to_plot)
 
@@ -795,27 +888,42 @@ def plot_taylor_diagram_many_heights(
         `taylor_diagram.TaylorDiagram`).
     """
 
-    error_checking.assert_is_geq_numpy_array(target_stdevs, 0.)
-    error_checking.assert_is_numpy_array(target_stdevs, num_dimensions=1)
+    target_stdevs = numpy.asarray(target_stdevs, dtype=numpy.float64)
+    prediction_stdevs = numpy.asarray(prediction_stdevs, dtype=numpy.float64)
+    correlations = numpy.asarray(correlations, dtype=numpy.float64)
+    heights_m_agl = numpy.asarray(heights_m_agl, dtype=numpy.float64)
 
-    num_heights = len(target_stdevs)
-    expected_dim = numpy.array([num_heights], dtype=int)
-
-    error_checking.assert_is_geq_numpy_array(prediction_stdevs, 0.)
-    error_checking.assert_is_numpy_array(
-        prediction_stdevs, exact_dimensions=expected_dim
-    )
+    if target_stdevs.ndim != 1:
+        raise ValueError('Target stdevs should be a 1-D numpy array.')
 
-    error_checking.assert_is_geq_numpy_array(correlations, -1., allow_nan=True)
-    error_checking.assert_is_leq_numpy_array(correlations, 1., allow_nan=True)
-    error_checking.assert_is_numpy_array(
-        correlations, exact_dimensions=expected_dim
-    )
+    num_heights = len(target_stdevs)
+    expected_shape = (num_heights,)
+
+    if not (
+            prediction_stdevs.shape == expected_shape and
+            correlations.shape == expected_shape and
+            heights_m_agl.shape == expected_shape
+    ):
+        error_string = (
+            'Prediction stdevs, correlations, and heights should all be '
+            'length-{0:d} numpy arrays.'
+        ).format(num_heights)
+
+        raise ValueError(error_string)
+
+    real_correlations = correlations[numpy.invert(numpy.isnan(correlations))]
+
+    if not (
+            (target_stdevs >= 0).all() and (prediction_stdevs >= 0).all() and
+            (heights_m_agl >= 0).all() and
+            (numpy.absolute(real_correlations) <= 1).all()
+    ):
+        error_string = (
+            'Stdevs and heights should all be non-negative; correlations '
+            'should all be in [-1, 1].'
+        )
 
-    error_checking.assert_is_geq_numpy_array(heights_m_agl, 0.)
-    error_checking.assert_is_numpy_array(
-        heights_m_agl, exact_dimensions=expected_dim
-    )
+        raise ValueError(error_string)
 
     heights_km_agl = heights_m_agl * METRES_TO_KM
     colour_norm_object = matplotlib.colors.LogNorm(
@@ -1,8 +1,8 @@
 """Applies trained neural net in inference mode."""
 
-import copy
 import os.path
 import argparse
+import functools
 import numpy
 from gewittergefahr.gg_utils import time_conversion
 from ml4rt.io import prediction_io
@@ -15,6 +15,7 @@ SEPARATOR_STRING = '\n\n' + '*' * 50 + '\n\n'
 
 TIME_FORMAT = '%Y-%m-%d-%H%M%S'
 NUM_EXAMPLES_PER_BATCH = 5000
+NUM_EXAMPLES_PER_DENORM_CHUNK = 131072
 ZERO_HEATING_HEIGHT_M_AGL = 49999.
 MAX_HEIGHT_M_AGL = 50001.
 
@@ -73,6 +74,75 @@ INPUT_ARG_PARSER.add_argument(
 )
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_time_string(time_string):
+    """Converts time string to Unix time, caching repeated parses.
+
+    `strptime` re-parses the format spec on every call, so caching keeps each
+    distinct time string to one parse per process.
+
+    :param time_string: Time string (format "yyyy-mm-dd-HHMMSS").
+    :return: time_unix_sec: Time in Unix format.
+    """
+
+    return time_conversion.string_to_unix_sec(time_string, TIME_FORMAT)
+
+
+def _denormalize_in_chunks(
+        prediction_example_dict, training_example_dict,
+        normalization_type_string, min_normalized_value, max_normalized_value,
+        apply_to_vector_targets, apply_to_scalar_targets):
+    """Denormalizes predictions one example chunk at a time.
+
+    `normalization.denormalize_data` writes into the value matrices in place,
+    so slicing the per-example matrices into chunks (views) denormalizes the
+    full dictionary while each pass stays small enough to sit in cache with
+    the per-height normalization stats.
+
+    :param prediction_example_dict: See doc for
+        `normalization.denormalize_data`.
+    :param training_example_dict: Same.
+    :param normalization_type_string: Same.
+    :param min_normalized_value: Same.
+    :param max_normalized_value: Same.
+    :param apply_to_vector_targets: Same.
+    :param apply_to_scalar_targets: Same.
+    :return: prediction_example_dict: Same as input but denormalized.
+    """
+
+    one_per_example_keys = [
+        example_utils.SCALAR_PREDICTOR_VALS_KEY,
+        example_utils.VECTOR_PREDICTOR_VALS_KEY,
+        example_utils.SCALAR_TARGET_VALS_KEY,
+        example_utils.VECTOR_TARGET_VALS_KEY
+    ]
+
+    num_examples = (
+        prediction_example_dict[example_utils.VECTOR_TARGET_VALS_KEY].shape[0]
+    )
+
+    for i in range(0, max([num_examples, 1]), NUM_EXAMPLES_PER_DENORM_CHUNK):
+        this_chunk_dict = dict(prediction_example_dict)
+
+        for this_key in one_per_example_keys:
+            this_chunk_dict[this_key] = prediction_example_dict[this_key][
+                i:(i + NUM_EXAMPLES_PER_DENORM_CHUNK), ...
+            ]
+
+        normalization.denormalize_data(
+            new_example_dict=this_chunk_dict,
+            training_example_dict=training_example_dict,
+            normalization_type_string=normalization_type_string,
+            min_normalized_value=min_normalized_value,
+            max_normalized_value=max_normalized_value,
+            separate_heights=True, apply_to_predictors=False,
+            apply_to_vector_targets=apply_to_vector_targets,
+            apply_to_scalar_targets=apply_to_scalar_targets
+        )
+
+    return prediction_example_dict
+
+
 def _get_unnormalized_pressure(model_metadata_dict, example_id_strings):
     """Returns profiles of unnormalized pressure.
 
@@ -84,7 +154,9 @@ def _get_unnormalized_pressure(model_metadata_dict, example_id_strings):
     :return: pressure_matrix_pascals: E-by-H numpy array of pressures.
     """
 
-    generator_option_dict = copy.deepcopy(
+    # Only top-level keys are overridden below, so a shallow copy is enough;
+    # deep-copying the whole options dict walks every nested array.
+    generator_option_dict = dict(
         model_metadata_dict[neural_net.TRAINING_OPTIONS_KEY]
     )
 
@@ -132,9 +204,7 @@ def _get_predicted_heating_rates(
     """
 
     num_examples = pressure_matrix_pascals.shape[0]
-    generator_option_dict = copy.deepcopy(
-        model_metadata_dict[neural_net.TRAINING_OPTIONS_KEY]
-    )
+    generator_option_dict = model_metadata_dict[neural_net.TRAINING_OPTIONS_KEY]
 
     this_dict = {
         example_utils.VECTOR_PREDICTOR_NAMES_KEY: [example_utils.PRESSURE_NAME],
@@ -142,8 +212,8 @@ def _get_predicted_heating_rates(
             numpy.expand_dims(pressure_matrix_pascals, axis=-1),
         example_utils.SCALAR_PREDICTOR_NAMES_KEY: [],
         example_utils.SCALAR_PREDICTOR_VALS_KEY:
-            numpy.full((num_examples, 0), 0.),
-        example_utils.VALID_TIMES_KEY: numpy.full(num_examples, 0, dtype=int)
+            numpy.empty((num_examples, 0), dtype=numpy.float32),
+        example_utils.VALID_TIMES_KEY: numpy.zeros(num_examples, dtype=int)
     }
     prediction_example_dict.update(this_dict)
 
@@ -179,9 +249,7 @@ def _targets_numpy_to_dict(
 
     net_type_string = model_metadata_dict[neural_net.NET_TYPE_KEY]
 
-    generator_option_dict = copy.deepcopy(
-        model_metadata_dict[neural_net.TRAINING_OPTIONS_KEY]
-    )
+    generator_option_dict = model_metadata_dict[neural_net.TRAINING_OPTIONS_KEY]
     vector_target_names = (
         generator_option_dict[neural_net.VECTOR_TARGET_NAMES_KEY]
     )
@@ -238,12 +306,8 @@ def _run(model_file_name, example_dir_name, first_time_string, last_time_string,
     :param output_file_name: Same.
     """
 
-    first_time_unix_sec = time_conversion.string_to_unix_sec(
-        first_time_string, TIME_FORMAT
-    )
-    last_time_unix_sec = time_conversion.string_to_unix_sec(
-        last_time_string, TIME_FORMAT
-    )
+    first_time_unix_sec = _parse_time_string(first_time_string)
+    last_time_unix_sec = _parse_time_string(last_time_string)
 
     print('Reading model from: "{0:s}"...'.format(model_file_name))
     model_object = neural_net.read_model(model_file_name)
@@ -260,17 +324,17 @@ def _run(model_file_name, example_dir_name, first_time_string, last_time_string,
         metadata_dict[neural_net.LOSS_FUNCTION_OR_DICT_KEY]
     )
 
-    generator_option_dict = copy.deepcopy(
-        metadata_dict[neural_net.TRAINING_OPTIONS_KEY]
-    )
+    # Only top-level keys are overridden below, so a shallow copy is enough;
+    # deep-copying the whole options dict walks every nested array.
+    generator_option_dict = dict(metadata_dict[neural_net.TRAINING_OPTIONS_KEY])
     generator_option_dict[neural_net.EXAMPLE_DIRECTORY_KEY] = example_dir_name
     generator_option_dict[neural_net.FIRST_TIME_KEY] = first_time_unix_sec
     generator_option_dict[neural_net.LAST_TIME_KEY] = last_time_unix_sec
 
-    vector_target_norm_type_string = copy.deepcopy(
+    vector_target_norm_type_string = (
         generator_option_dict[neural_net.VECTOR_TARGET_NORM_TYPE_KEY]
     )
-    scalar_target_norm_type_string = copy.deepcopy(
+    scalar_target_norm_type_string = (
         generator_option_dict[neural_net.SCALAR_TARGET_NORM_TYPE_KEY]
     )
     generator_option_dict[neural_net.VECTOR_TARGET_NORM_TYPE_KEY] = None
@@ -339,58 +403,67 @@ def _run(model_file_name, example_dir_name, first_time_string, last_time_string,
     this_dict = {
         example_utils.VECTOR_PREDICTOR_NAMES_KEY: [],
         example_utils.VECTOR_PREDICTOR_VALS_KEY:
-            numpy.full((num_examples, num_heights, 0), 0.),
+            numpy.empty((num_examples, num_heights, 0), dtype=numpy.float32),
         example_utils.SCALAR_PREDICTOR_NAMES_KEY: [],
         example_utils.SCALAR_PREDICTOR_VALS_KEY:
-            numpy.full((num_examples, 0), 0.)
+            numpy.empty((num_examples, 0), dtype=numpy.float32)
     }
 
     target_example_dict.update(this_dict)
     prediction_example_dict.update(this_dict)
 
-    if vector_target_norm_type_string is not None:
-        print('Denormalizing predicted vectors...')
+    # When vector and scalar targets share normalization settings, one
+    # denormalization pass handles both, halving the stat lookups.
+    fuse_denorm_calls = (
+        vector_target_norm_type_string is not None and
+        scalar_target_norm_type_string == vector_target_norm_type_string and
+        generator_option_dict[neural_net.VECTOR_TARGET_MIN_VALUE_KEY] ==
+        generator_option_dict[neural_net.SCALAR_TARGET_MIN_VALUE_KEY] and
+        generator_option_dict[neural_net.VECTOR_TARGET_MAX_VALUE_KEY] ==
+        generator_option_dict[neural_net.SCALAR_TARGET_MAX_VALUE_KEY]
+    )
 
-        # down_flux_inc_matrix_w_m03 = example_utils.get_field_from_dict(
-        #     example_dict=prediction_example_dict,
-        #     field_name=example_utils.SHORTWAVE_DOWN_FLUX_INC_NAME
-        # )
-        # print(down_flux_inc_matrix_w_m03[0, ...])
-        # print('\n')
+    if fuse_denorm_calls:
+        print('Denormalizing predicted vectors and scalars...')
 
-        prediction_example_dict = normalization.denormalize_data(
-            new_example_dict=prediction_example_dict,
+        prediction_example_dict = _denormalize_in_chunks(
+            prediction_example_dict=prediction_example_dict,
             training_example_dict=training_example_dict,
             normalization_type_string=vector_target_norm_type_string,
             min_normalized_value=
             generator_option_dict[neural_net.VECTOR_TARGET_MIN_VALUE_KEY],
             max_normalized_value=
             generator_option_dict[neural_net.VECTOR_TARGET_MAX_VALUE_KEY],
-            separate_heights=True, apply_to_predictors=False,
-            apply_to_vector_targets=True, apply_to_scalar_targets=False
+            apply_to_vector_targets=True, apply_to_scalar_targets=True
         )
+    else:
+        if vector_target_norm_type_string is not None:
+            print('Denormalizing predicted vectors...')
+
+            prediction_example_dict = _denormalize_in_chunks(
+                prediction_example_dict=prediction_example_dict,
+                training_example_dict=training_example_dict,
+                normalization_type_string=vector_target_norm_type_string,
+                min_normalized_value=
+                generator_option_dict[neural_net.VECTOR_TARGET_MIN_VALUE_KEY],
+                max_normalized_value=
+                generator_option_dict[neural_net.VECTOR_TARGET_MAX_VALUE_KEY],
+                apply_to_vector_targets=True, apply_to_scalar_targets=False
+            )
 
-        # down_flux_inc_matrix_w_m03 = example_utils.get_field_from_dict(
-        #     example_dict=prediction_example_dict,
-        #     field_name=example_utils.SHORTWAVE_DOWN_FLUX_INC_NAME
-        # )
-        # print(down_flux_inc_matrix_w_m03[0, ...])
-        # print('\n\n\n')
-
-    if scalar_target_norm_type_string is not None:
-        print('Denormalizing predicted scalars...')
-
-        prediction_example_dict = normalization.denormalize_data(
-            new_example_dict=prediction_example_dict,
-            training_example_dict=training_example_dict,
-            normalization_type_string=scalar_target_norm_type_string,
-            min_normalized_value=
-            generator_option_dict[neural_net.SCALAR_TARGET_MIN_VALUE_KEY],
-            max_normalized_value=
-            generator_option_dict[neural_net.SCALAR_TARGET_MAX_VALUE_KEY],
-            separate_heights=True, apply_to_predictors=False,
-            apply_to_vector_targets=False, apply_to_scalar_targets=True
-        )
+        if scalar_target_norm_type_string is not None:
+            print('Denormalizing predicted scalars...')
+
+            prediction_example_dict = _denormalize_in_chunks(
+                prediction_example_dict=prediction_example_dict,
+                training_example_dict=training_example_dict,
+                normalization_type_string=scalar_target_norm_type_string,
+                min_normalized_value=
+                generator_option_dict[neural_net.SCALAR_TARGET_MIN_VALUE_KEY],
+                max_normalized_value=
+                generator_option_dict[neural_net.SCALAR_TARGET_MAX_VALUE_KEY],
+                apply_to_vector_targets=False, apply_to_scalar_targets=True
+            )
 
     add_heating_rate = generator_option_dict[neural_net.OMIT_HEATING_RATE_KEY]
 
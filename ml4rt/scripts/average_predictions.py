@@ -74,7 +74,6 @@ def _run(input_file_name, use_pmm, max_pmm_percentile_level, output_file_name):
     )
 
     example_id_strings = [example_utils.get_dummy_example_id()]
-    print(example_id_strings)
 
     print('Writing mean example to: "{0:s}"...'.format(output_file_name))
     prediction_io.write_file(
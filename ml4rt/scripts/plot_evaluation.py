@@ -363,9 +363,17 @@ def _plot_attributes_diagram(
             example_utils.VECTOR_TARGET_VALS_KEY
         ][0, j, k]
 
+    mean_predictions_no_bs_by_set = [
+        None if a is None else numpy.nanmean(a, axis=-1)
+        for a in mean_predictions_by_set
+    ]
+    mean_observations_no_bs_by_set = [
+        None if a is None else numpy.nanmean(a, axis=-1)
+        for a in mean_observations_by_set
+    ]
+
     concat_values = numpy.concatenate([
-        numpy.nanmean(a, axis=-1)
-        for a in mean_predictions_by_set + mean_observations_by_set
+        a for a in mean_predictions_no_bs_by_set + mean_observations_no_bs_by_set
         if a is not None
     ])
     max_value_to_plot = numpy.nanpercentile(concat_values, 99.9)
@@ -384,10 +392,8 @@ def _plot_attributes_diagram(
 
         this_handle = evaluation_plotting.plot_attributes_diagram(
             figure_object=figure_object, axes_object=axes_object,
-            mean_predictions=
-            numpy.nanmean(mean_predictions_by_set[main_index], axis=-1),
-            mean_observations=
-            numpy.nanmean(mean_observations_by_set[main_index], axis=-1),
+            mean_predictions=mean_predictions_no_bs_by_set[main_index],
+            mean_observations=mean_observations_no_bs_by_set[main_index],
             mean_value_in_training=climo_value,
             min_value_to_plot=min_value_to_plot,
             max_value_to_plot=max_value_to_plot,
@@ -453,10 +459,8 @@ def _plot_attributes_diagram(
 
             this_handle = evaluation_plotting._plot_reliability_curve(
                 axes_object=axes_object,
-                mean_predictions=
-                numpy.nanmean(mean_predictions_by_set[i], axis=-1),
-                mean_observations=
-                numpy.nanmean(mean_observations_by_set[i], axis=-1),
+                mean_predictions=mean_predictions_no_bs_by_set[i],
+                mean_observations=mean_observations_no_bs_by_set[i],
                 min_value_to_plot=min_value_to_plot,
                 max_value_to_plot=max_value_to_plot,
                 line_colour=line_colours[i], line_style=line_styles[i],
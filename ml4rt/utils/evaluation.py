@@ -3,7 +3,6 @@
 import os.path
 import numpy
 import xarray
-from gewittergefahr.gg_utils import histograms
 from gewittergefahr.gg_utils import file_system_utils
 from gewittergefahr.gg_utils import error_checking
 from ml4rt.io import example_io
@@ -233,16 +232,12 @@ def _get_correlation_one_scalar(target_values, predicted_values):
     :return: correlation: Self-explanatory.
     """
 
-    numerator = numpy.sum(
-        (target_values - numpy.mean(target_values)) *
-        (predicted_values - numpy.mean(predicted_values))
-    )
-    sum_squared_target_diffs = numpy.sum(
-        (target_values - numpy.mean(target_values)) ** 2
-    )
-    sum_squared_prediction_diffs = numpy.sum(
-        (predicted_values - numpy.mean(predicted_values)) ** 2
-    )
+    target_anomalies = target_values - numpy.mean(target_values)
+    prediction_anomalies = predicted_values - numpy.mean(predicted_values)
+
+    numerator = numpy.sum(target_anomalies * prediction_anomalies)
+    sum_squared_target_diffs = numpy.sum(target_anomalies ** 2)
+    sum_squared_prediction_diffs = numpy.sum(prediction_anomalies ** 2)
 
     correlation = (
         numerator /
@@ -252,6 +247,93 @@ def _get_correlation_one_scalar(target_values, predicted_values):
     return correlation
 
 
+def _get_correlation_all_columns(target_matrix, prediction_matrix):
+    """Computes Pearson correlation for each column of target variables.
+
+    The reduction runs over the first (example) axis, so the input matrices
+    may have any number of trailing dimensions -- e.g., (E x T_s) for scalar
+    targets or (E x H x T_v) for vector targets.
+
+    :param target_matrix: numpy array of target (actual) values, where the
+        first axis has length E.
+    :param prediction_matrix: numpy array of predicted values, with the same
+        shape as `target_matrix`.
+    :return: correlation_matrix: numpy array of correlations, with the same
+        shape as `target_matrix` minus the first axis.
+    """
+
+    num_examples = target_matrix.shape[0]
+    column_shape = target_matrix.shape[1:]
+
+    target_anomaly_matrix = (
+        target_matrix - numpy.mean(target_matrix, axis=0, keepdims=True)
+    ).reshape(num_examples, -1)
+    prediction_anomaly_matrix = (
+        prediction_matrix - numpy.mean(prediction_matrix, axis=0, keepdims=True)
+    ).reshape(num_examples, -1)
+
+    # einsum computes each sum of products without materializing the
+    # element-wise product as an (E x T) intermediate.
+    numerator_values = numpy.einsum(
+        'ij,ij->j', target_anomaly_matrix, prediction_anomaly_matrix,
+        dtype=numpy.float64, optimize=True
+    )
+    denominator_values = numpy.sqrt(
+        numpy.einsum(
+            'ij,ij->j', target_anomaly_matrix, target_anomaly_matrix,
+            dtype=numpy.float64, optimize=True
+        ) *
+        numpy.einsum(
+            'ij,ij->j', prediction_anomaly_matrix, prediction_anomaly_matrix,
+            dtype=numpy.float64, optimize=True
+        )
+    )
+
+    return (numerator_values / denominator_values).reshape(column_shape)
+
+
+def _get_stdevs_all_columns(data_matrix):
+    """Computes sample standard deviation for each column of data.
+
+    As in `_get_correlation_all_columns`, the reduction runs over the first
+    (example) axis and the input may have any number of trailing dimensions.
+    The sums of values and squared values are taken in one traversal each,
+    and the variance comes from the identity
+    var = (sum(x^2) - sum(x)^2 / E) / (E - 1), so no centered copy of the
+    data is materialized.
+
+    :param data_matrix: numpy array of data values, where the first axis has
+        length E.
+    :return: stdev_matrix: numpy array of standard deviations (with one degree
+        of freedom), with the same shape as `data_matrix` minus the first
+        axis.
+    """
+
+    num_examples = data_matrix.shape[0]
+    column_shape = data_matrix.shape[1:]
+
+    if num_examples < 2:
+        return numpy.full(column_shape, numpy.nan)
+
+    # The sums accumulate in double precision even when the data are single-
+    # precision, since the variance identity below is prone to cancellation.
+    flat_data_matrix = data_matrix.reshape(num_examples, -1)
+    sum_values = numpy.einsum(
+        'ij->j', flat_data_matrix, dtype=numpy.float64, optimize=True
+    )
+    sum_squared_values = numpy.einsum(
+        'ij,ij->j', flat_data_matrix, flat_data_matrix, dtype=numpy.float64,
+        optimize=True
+    )
+
+    variances = (
+        (sum_squared_values - sum_values ** 2 / num_examples) /
+        (num_examples - 1)
+    )
+
+    return numpy.sqrt(numpy.maximum(variances, 0.)).reshape(column_shape)
+
+
 def _get_kge_one_scalar(target_values, predicted_values):
     """Computes KGE (Kling-Gupta efficiency) for one scalar target variable.
 
@@ -284,6 +366,41 @@ def _get_kge_one_scalar(target_values, predicted_values):
     return kge
 
 
+def _get_kge_all_columns(target_matrix, prediction_matrix):
+    """Computes KGE (Kling-Gupta efficiency) for each column of targets.
+
+    As in `_get_correlation_all_columns`, the reduction runs over the first
+    (example) axis and the input matrices may have any number of trailing
+    dimensions.
+
+    :param target_matrix: See doc for `_get_correlation_all_columns`.
+    :param prediction_matrix: Same.
+    :return: kge_matrix: numpy array of KGE values, with the same shape as
+        `target_matrix` minus the first axis.
+    """
+
+    correlation_matrix = _get_correlation_all_columns(
+        target_matrix=target_matrix, prediction_matrix=prediction_matrix
+    )
+
+    target_mean_matrix = numpy.mean(target_matrix, axis=0)
+    prediction_mean_matrix = numpy.mean(prediction_matrix, axis=0)
+    target_stdev_matrix = _get_stdevs_all_columns(target_matrix)
+    prediction_stdev_matrix = _get_stdevs_all_columns(prediction_matrix)
+
+    variance_bias_matrix = (
+        (prediction_stdev_matrix / prediction_mean_matrix) *
+        (target_stdev_matrix / target_mean_matrix) ** -1
+    )
+    mean_bias_matrix = prediction_mean_matrix / target_mean_matrix
+
+    return 1. - numpy.sqrt(
+        (correlation_matrix - 1.) ** 2 +
+        (variance_bias_matrix - 1.) ** 2 +
+        (mean_bias_matrix - 1.) ** 2
+    )
+
+
 def _get_prmse_one_variable(target_matrix, prediction_matrix):
     """Computes profile root mean squared error (PRMSE) for one variable.
 
@@ -327,27 +444,110 @@ def _get_rel_curve_one_scalar(
     max_bin_edge = max([max_bin_edge, numpy.finfo(float).eps])
     min_bin_edge = min([min_bin_edge, 0.])
 
-    bin_index_by_example = histograms.create_histogram(
-        input_values=target_values if invert else predicted_values,
-        num_bins=num_bins, min_value=min_bin_edge, max_value=max_bin_edge
-    )[0]
-
-    mean_predictions = numpy.full(num_bins, numpy.nan)
-    mean_observations = numpy.full(num_bins, numpy.nan)
-    example_counts = numpy.full(num_bins, -1, dtype=int)
+    binning_values = target_values if invert else predicted_values
+    bin_index_by_example = numpy.clip(
+        numpy.floor(
+            num_bins * (binning_values - min_bin_edge) /
+            (max_bin_edge - min_bin_edge)
+        ).astype(int),
+        0, num_bins - 1
+    )
 
-    for i in range(num_bins):
-        these_example_indices = numpy.where(bin_index_by_example == i)[0]
+    # One `bincount` pass over the examples fills each accumulator, instead of
+    # scanning the bin-index array once per bin.
+    example_counts = numpy.bincount(bin_index_by_example, minlength=num_bins)
+    prediction_sums = numpy.bincount(
+        bin_index_by_example, weights=predicted_values, minlength=num_bins
+    )
+    observation_sums = numpy.bincount(
+        bin_index_by_example, weights=target_values, minlength=num_bins
+    )
 
-        example_counts[i] = len(these_example_indices)
-        mean_predictions[i] = numpy.mean(
-            predicted_values[these_example_indices]
-        )
-        mean_observations[i] = numpy.mean(target_values[these_example_indices])
+    nonzero_counts = numpy.maximum(example_counts, 1)
+    mean_predictions = numpy.where(
+        example_counts == 0, numpy.nan, prediction_sums / nonzero_counts
+    )
+    mean_observations = numpy.where(
+        example_counts == 0, numpy.nan, observation_sums / nonzero_counts
+    )
 
     return mean_predictions, mean_observations, example_counts
 
 
+def _get_rel_curves_all_columns(
+        target_matrix, prediction_matrix, num_bins, max_bin_edge_by_column,
+        invert=False):
+    """Computes reliability curves for many target variables at once.
+
+    T = number of target variables (columns)
+    B = number of bins
+
+    This is the batched version of `_get_rel_curve_one_scalar` for curves
+    whose first bin starts at zero: bin indices for the whole (E x T) matrix
+    are found with integer arithmetic, and all T curves are accumulated with
+    one `numpy.add.at` call per quantity.
+
+    :param target_matrix: E-by-T numpy array of target (actual) values.
+    :param prediction_matrix: E-by-T numpy array of predicted values.
+    :param num_bins: Number of bins (points in each curve).
+    :param max_bin_edge_by_column: length-T numpy array with value at upper
+        edge of last bin, for each column.  The lower edge of the first bin is
+        always zero.
+    :param invert: See doc for `_get_rel_curve_one_scalar`.
+    :return: mean_prediction_matrix: T-by-B numpy array of x-coordinates.
+    :return: mean_observation_matrix: T-by-B numpy array of y-coordinates.
+    :return: example_count_matrix: T-by-B numpy array with num examples in
+        each bin.
+    """
+
+    max_bin_edge_by_column = numpy.maximum(
+        max_bin_edge_by_column, numpy.finfo(float).eps
+    )
+
+    binning_matrix = target_matrix if invert else prediction_matrix
+    bin_index_matrix = numpy.clip(
+        numpy.floor(
+            binning_matrix * (num_bins / max_bin_edge_by_column)
+        ).astype(int),
+        0, num_bins - 1
+    )
+
+    num_columns = binning_matrix.shape[1]
+    column_index_matrix = numpy.broadcast_to(
+        numpy.arange(num_columns), bin_index_matrix.shape
+    )
+
+    example_count_matrix = numpy.zeros((num_columns, num_bins), dtype=int)
+    prediction_sum_matrix = numpy.zeros((num_columns, num_bins))
+    observation_sum_matrix = numpy.zeros((num_columns, num_bins))
+
+    numpy.add.at(
+        example_count_matrix, (column_index_matrix, bin_index_matrix), 1
+    )
+    numpy.add.at(
+        prediction_sum_matrix, (column_index_matrix, bin_index_matrix),
+        prediction_matrix
+    )
+    numpy.add.at(
+        observation_sum_matrix, (column_index_matrix, bin_index_matrix),
+        target_matrix
+    )
+
+    nonzero_count_matrix = numpy.maximum(example_count_matrix, 1)
+    mean_prediction_matrix = numpy.where(
+        example_count_matrix == 0, numpy.nan,
+        prediction_sum_matrix / nonzero_count_matrix
+    )
+    mean_observation_matrix = numpy.where(
+        example_count_matrix == 0, numpy.nan,
+        observation_sum_matrix / nonzero_count_matrix
+    )
+
+    return (
+        mean_prediction_matrix, mean_observation_matrix, example_count_matrix
+    )
+
+
 def _get_scores_one_replicate(
         result_table_xarray, prediction_dict, replicate_index,
         example_indices_in_replicate, mean_training_example_dict,
@@ -429,249 +629,306 @@ def _get_scores_one_replicate(
 
     num_aux_targets = len(aux_target_field_names)
 
-    for k in range(num_scalar_targets):
-        this_climo_value = mean_training_example_dict[
-            example_utils.SCALAR_TARGET_VALS_KEY
-        ][0, k]
+    # MSE, MAE, and bias are computed for all scalar targets at once, so that
+    # each statistic is one numpy reduction over the (E x T_s) matrix instead
+    # of T_s separate Python calls.  The error matrix is shared between the
+    # three statistics.
+    scalar_climo_values = mean_training_example_dict[
+        example_utils.SCALAR_TARGET_VALS_KEY
+    ][0, :]
+
+    scalar_diff_matrix = scalar_prediction_matrix - scalar_target_matrix
+    scalar_climo_diff_matrix = scalar_target_matrix - scalar_climo_values
+
+    # Climo MSE comes from the identity E[(t - c)^2] = var(t) + (mean(t) - c)^2
+    # with cached per-column moments, rather than a second squared-error pass.
+    scalar_target_means = numpy.mean(scalar_target_matrix, axis=0)
+    scalar_target_variances = numpy.var(scalar_target_matrix, axis=0)
+
+    scalar_mse_values = numpy.mean(scalar_diff_matrix ** 2, axis=0)
+    scalar_climo_mse_values = (
+        scalar_target_variances +
+        (scalar_target_means - scalar_climo_values) ** 2
+    )
+    scalar_mae_values = numpy.mean(numpy.abs(scalar_diff_matrix), axis=0)
+    scalar_climo_mae_values = numpy.mean(
+        numpy.abs(scalar_climo_diff_matrix), axis=0
+    )
 
-        t[SCALAR_TARGET_STDEV_KEY].values[k, i] = numpy.std(
-            scalar_target_matrix[:, k], ddof=1
-        )
-        t[SCALAR_PREDICTION_STDEV_KEY].values[k, i] = numpy.std(
-            scalar_prediction_matrix[:, k], ddof=1
-        )
-        t[SCALAR_MAE_KEY].values[k, i] = _get_mae_one_scalar(
-            target_values=scalar_target_matrix[:, k],
-            predicted_values=scalar_prediction_matrix[:, k]
-        )
-        t[SCALAR_MAE_SKILL_KEY].values[k, i] = _get_mae_ss_one_scalar(
-            target_values=scalar_target_matrix[:, k],
-            predicted_values=scalar_prediction_matrix[:, k],
-            mean_training_target_value=this_climo_value
-        )
-        t[SCALAR_MSE_KEY].values[k, i] = _get_mse_one_scalar(
-            target_values=scalar_target_matrix[:, k],
-            predicted_values=scalar_prediction_matrix[:, k]
-        )
-        t[SCALAR_MSE_SKILL_KEY].values[k, i] = _get_mse_ss_one_scalar(
-            target_values=scalar_target_matrix[:, k],
-            predicted_values=scalar_prediction_matrix[:, k],
-            mean_training_target_value=this_climo_value
-        )
-        t[SCALAR_BIAS_KEY].values[k, i] = _get_bias_one_scalar(
-            target_values=scalar_target_matrix[:, k],
-            predicted_values=scalar_prediction_matrix[:, k]
-        )
-        t[SCALAR_CORRELATION_KEY].values[k, i] = _get_correlation_one_scalar(
-            target_values=scalar_target_matrix[:, k],
-            predicted_values=scalar_prediction_matrix[:, k]
+    t[SCALAR_MSE_KEY].values[:, i] = scalar_mse_values
+    t[SCALAR_MSE_SKILL_KEY].values[:, i] = (
+        (scalar_climo_mse_values - scalar_mse_values) / scalar_climo_mse_values
+    )
+    t[SCALAR_MAE_KEY].values[:, i] = scalar_mae_values
+    t[SCALAR_MAE_SKILL_KEY].values[:, i] = (
+        (scalar_climo_mae_values - scalar_mae_values) / scalar_climo_mae_values
+    )
+    t[SCALAR_BIAS_KEY].values[:, i] = numpy.mean(scalar_diff_matrix, axis=0)
+    t[SCALAR_CORRELATION_KEY].values[:, i] = _get_correlation_all_columns(
+        target_matrix=scalar_target_matrix,
+        prediction_matrix=scalar_prediction_matrix
+    )
+
+    t[SCALAR_TARGET_STDEV_KEY].values[:, i] = _get_stdevs_all_columns(
+        scalar_target_matrix
+    )
+    t[SCALAR_PREDICTION_STDEV_KEY].values[:, i] = _get_stdevs_all_columns(
+        scalar_prediction_matrix
+    )
+
+    t[SCALAR_KGE_KEY].values[:, i] = _get_kge_all_columns(
+        target_matrix=scalar_target_matrix,
+        prediction_matrix=scalar_prediction_matrix
+    )
+
+    # All scalar reliability curves are accumulated at once, with one batched
+    # percentile call for the bin edges.
+    if num_examples == 0:
+        scalar_max_bin_edges = numpy.full(num_scalar_targets, 1.)
+    else:
+        scalar_max_bin_edges = numpy.percentile(
+            full_scalar_prediction_matrix, max_bin_edge_percentile, axis=0
         )
-        t[SCALAR_KGE_KEY].values[k, i] = _get_kge_one_scalar(
-            target_values=scalar_target_matrix[:, k],
-            predicted_values=scalar_prediction_matrix[:, k]
+
+    (
+        t[SCALAR_RELIABILITY_X_KEY].values[..., i],
+        t[SCALAR_RELIABILITY_Y_KEY].values[..., i]
+    ) = _get_rel_curves_all_columns(
+        target_matrix=scalar_target_matrix,
+        prediction_matrix=scalar_prediction_matrix,
+        num_bins=num_reliability_bins,
+        max_bin_edge_by_column=scalar_max_bin_edges, invert=False
+    )[:2]
+
+    if i == 0:
+        (
+            t[SCALAR_RELIA_BIN_CENTER_KEY].values[:], _,
+            t[SCALAR_RELIABILITY_COUNT_KEY].values[:]
+        ) = _get_rel_curves_all_columns(
+            target_matrix=full_scalar_target_matrix,
+            prediction_matrix=full_scalar_prediction_matrix,
+            num_bins=num_reliability_bins,
+            max_bin_edge_by_column=scalar_max_bin_edges, invert=False
         )
 
         if num_examples == 0:
-            max_bin_edge = 1.
+            scalar_max_bin_edges = numpy.full(num_scalar_targets, 1.)
         else:
-            max_bin_edge = numpy.percentile(
-                full_scalar_prediction_matrix[:, k], max_bin_edge_percentile
+            scalar_max_bin_edges = numpy.percentile(
+                full_scalar_target_matrix, max_bin_edge_percentile, axis=0
             )
 
         (
-            t[SCALAR_RELIABILITY_X_KEY].values[k, :, i],
-            t[SCALAR_RELIABILITY_Y_KEY].values[k, :, i]
-        ) = _get_rel_curve_one_scalar(
-            target_values=scalar_target_matrix[:, k],
-            predicted_values=scalar_prediction_matrix[:, k],
+            t[SCALAR_INV_RELIA_BIN_CENTER_KEY].values[:], _,
+            t[SCALAR_INV_RELIABILITY_COUNT_KEY].values[:]
+        ) = _get_rel_curves_all_columns(
+            target_matrix=full_scalar_target_matrix,
+            prediction_matrix=full_scalar_prediction_matrix,
             num_bins=num_reliability_bins,
-            min_bin_edge=0., max_bin_edge=max_bin_edge, invert=False
-        )[:2]
+            max_bin_edge_by_column=scalar_max_bin_edges, invert=True
+        )
 
-        if i == 0:
-            (
-                t[SCALAR_RELIA_BIN_CENTER_KEY].values[k, :], _,
-                t[SCALAR_RELIABILITY_COUNT_KEY].values[k, :]
-            ) = _get_rel_curve_one_scalar(
-                target_values=full_scalar_target_matrix[:, k],
-                predicted_values=full_scalar_prediction_matrix[:, k],
-                num_bins=num_reliability_bins,
-                min_bin_edge=0., max_bin_edge=max_bin_edge, invert=False
-            )
+    # Same treatment for the vector targets: one reduction over the
+    # (E x H x T_v) matrices replaces H * T_v trips through the per-column
+    # helpers, and the reduction runs over the leading axis, which is
+    # contiguous in C order.
+    vector_climo_matrix = mean_training_example_dict[
+        example_utils.VECTOR_TARGET_VALS_KEY
+    ][0, ...]
 
-        if num_examples == 0:
-            max_bin_edge = 1.
-        else:
-            max_bin_edge = numpy.percentile(
-                full_scalar_target_matrix[:, k], max_bin_edge_percentile
-            )
+    vector_diff_matrix = vector_prediction_matrix - vector_target_matrix
+    vector_climo_diff_matrix = vector_target_matrix - vector_climo_matrix
 
-        if i == 0:
-            (
-                t[SCALAR_INV_RELIA_BIN_CENTER_KEY].values[k, :], _,
-                t[SCALAR_INV_RELIABILITY_COUNT_KEY].values[k, :]
-            ) = _get_rel_curve_one_scalar(
-                target_values=full_scalar_target_matrix[:, k],
-                predicted_values=full_scalar_prediction_matrix[:, k],
-                num_bins=num_reliability_bins,
-                min_bin_edge=0., max_bin_edge=max_bin_edge, invert=True
-            )
+    vector_target_mean_matrix = numpy.mean(vector_target_matrix, axis=0)
+    vector_target_variance_matrix = numpy.var(vector_target_matrix, axis=0)
+
+    vector_mse_matrix = numpy.mean(vector_diff_matrix ** 2, axis=0)
+    vector_climo_mse_matrix = (
+        vector_target_variance_matrix +
+        (vector_target_mean_matrix - vector_climo_matrix) ** 2
+    )
+    vector_mae_matrix = numpy.mean(numpy.abs(vector_diff_matrix), axis=0)
+    vector_climo_mae_matrix = numpy.mean(
+        numpy.abs(vector_climo_diff_matrix), axis=0
+    )
+
+    t[VECTOR_MSE_KEY].values[..., i] = vector_mse_matrix
+    t[VECTOR_MSE_SKILL_KEY].values[..., i] = (
+        (vector_climo_mse_matrix - vector_mse_matrix) /
+        vector_climo_mse_matrix
+    )
+    t[VECTOR_MAE_KEY].values[..., i] = vector_mae_matrix
+    t[VECTOR_MAE_SKILL_KEY].values[..., i] = (
+        (vector_climo_mae_matrix - vector_mae_matrix) /
+        vector_climo_mae_matrix
+    )
+    t[VECTOR_BIAS_KEY].values[..., i] = numpy.mean(vector_diff_matrix, axis=0)
+    t[VECTOR_PRMSE_KEY].values[:, i] = numpy.mean(
+        numpy.sqrt(numpy.mean(vector_diff_matrix ** 2, axis=1)), axis=0
+    )
+    t[VECTOR_CORRELATION_KEY].values[..., i] = _get_correlation_all_columns(
+        target_matrix=vector_target_matrix,
+        prediction_matrix=vector_prediction_matrix
+    )
 
-    for k in range(num_vector_targets):
-        t[VECTOR_PRMSE_KEY].values[k, i] = _get_prmse_one_variable(
-            target_matrix=vector_target_matrix[..., k],
-            prediction_matrix=vector_prediction_matrix[..., k]
+    t[VECTOR_TARGET_STDEV_KEY].values[..., i] = _get_stdevs_all_columns(
+        vector_target_matrix
+    )
+    t[VECTOR_PREDICTION_STDEV_KEY].values[..., i] = _get_stdevs_all_columns(
+        vector_prediction_matrix
+    )
+
+    t[VECTOR_KGE_KEY].values[..., i] = _get_kge_all_columns(
+        target_matrix=vector_target_matrix,
+        prediction_matrix=vector_prediction_matrix
+    )
+
+    # The (E x H x T_v) matrices are viewed as (E x [H * T_v]) so that all
+    # vector reliability curves go through the same batched path as the
+    # scalar ones.
+    num_vector_columns = num_heights * num_vector_targets
+    these_dim = (num_heights, num_vector_targets, num_reliability_bins)
+
+    if num_examples == 0:
+        vector_max_bin_edges = numpy.full(num_vector_columns, 1.)
+    else:
+        vector_max_bin_edges = numpy.percentile(
+            full_vector_prediction_matrix.reshape(-1, num_vector_columns),
+            max_bin_edge_percentile, axis=0
         )
 
-        for j in range(num_heights):
-            this_climo_value = mean_training_example_dict[
-                example_utils.VECTOR_TARGET_VALS_KEY
-            ][0, j, k]
+    these_x_matrix, these_y_matrix = _get_rel_curves_all_columns(
+        target_matrix=vector_target_matrix.reshape(-1, num_vector_columns),
+        prediction_matrix=
+        vector_prediction_matrix.reshape(-1, num_vector_columns),
+        num_bins=num_reliability_bins,
+        max_bin_edge_by_column=vector_max_bin_edges, invert=False
+    )[:2]
 
-            t[VECTOR_TARGET_STDEV_KEY].values[j, k, i] = numpy.std(
-                vector_target_matrix[:, j, k], ddof=1
-            )
-            t[VECTOR_PREDICTION_STDEV_KEY].values[j, k, i] = numpy.std(
-                vector_prediction_matrix[:, j, k], ddof=1
-            )
-            t[VECTOR_MAE_KEY].values[j, k, i] = _get_mae_one_scalar(
-                target_values=vector_target_matrix[:, j, k],
-                predicted_values=vector_prediction_matrix[:, j, k]
-            )
-            t[VECTOR_MAE_SKILL_KEY].values[j, k, i] = _get_mae_ss_one_scalar(
-                target_values=vector_target_matrix[:, j, k],
-                predicted_values=vector_prediction_matrix[:, j, k],
-                mean_training_target_value=this_climo_value
-            )
-            t[VECTOR_MSE_KEY].values[j, k, i] = _get_mse_one_scalar(
-                target_values=vector_target_matrix[:, j, k],
-                predicted_values=vector_prediction_matrix[:, j, k]
-            )
-            t[VECTOR_MSE_SKILL_KEY].values[j, k, i] = _get_mse_ss_one_scalar(
-                target_values=vector_target_matrix[:, j, k],
-                predicted_values=vector_prediction_matrix[:, j, k],
-                mean_training_target_value=this_climo_value
-            )
-            t[VECTOR_BIAS_KEY].values[j, k, i] = _get_bias_one_scalar(
-                target_values=vector_target_matrix[:, j, k],
-                predicted_values=vector_prediction_matrix[:, j, k]
-            )
-            t[VECTOR_CORRELATION_KEY].values[j, k, i] = (
-                _get_correlation_one_scalar(
-                    target_values=vector_target_matrix[:, j, k],
-                    predicted_values=vector_prediction_matrix[:, j, k]
-                )
-            )
-            t[VECTOR_KGE_KEY].values[j, k, i] = _get_kge_one_scalar(
-                target_values=vector_target_matrix[:, j, k],
-                predicted_values=vector_prediction_matrix[:, j, k]
+    t[VECTOR_RELIABILITY_X_KEY].values[..., i] = these_x_matrix.reshape(
+        these_dim
+    )
+    t[VECTOR_RELIABILITY_Y_KEY].values[..., i] = these_y_matrix.reshape(
+        these_dim
+    )
+
+    if i == 0:
+        these_x_matrix, _, these_count_matrix = _get_rel_curves_all_columns(
+            target_matrix=
+            full_vector_target_matrix.reshape(-1, num_vector_columns),
+            prediction_matrix=
+            full_vector_prediction_matrix.reshape(-1, num_vector_columns),
+            num_bins=num_reliability_bins,
+            max_bin_edge_by_column=vector_max_bin_edges, invert=False
+        )
+
+        t[VECTOR_RELIA_BIN_CENTER_KEY].values[:] = these_x_matrix.reshape(
+            these_dim
+        )
+        t[VECTOR_RELIABILITY_COUNT_KEY].values[:] = these_count_matrix.reshape(
+            these_dim
+        )
+
+        if num_examples == 0:
+            vector_max_bin_edges = numpy.full(num_vector_columns, 1.)
+        else:
+            vector_max_bin_edges = numpy.percentile(
+                full_vector_target_matrix.reshape(-1, num_vector_columns),
+                max_bin_edge_percentile, axis=0
             )
 
-            if num_examples == 0:
-                max_bin_edge = 1.
-            else:
-                max_bin_edge = numpy.percentile(
-                    full_vector_prediction_matrix[:, j, k],
-                    max_bin_edge_percentile
-                )
+        these_x_matrix, _, these_count_matrix = _get_rel_curves_all_columns(
+            target_matrix=
+            full_vector_target_matrix.reshape(-1, num_vector_columns),
+            prediction_matrix=
+            full_vector_prediction_matrix.reshape(-1, num_vector_columns),
+            num_bins=num_reliability_bins,
+            max_bin_edge_by_column=vector_max_bin_edges, invert=True
+        )
 
-            (
-                t[VECTOR_RELIABILITY_X_KEY].values[j, k, :, i],
-                t[VECTOR_RELIABILITY_Y_KEY].values[j, k, :, i]
-            ) = _get_rel_curve_one_scalar(
-                target_values=vector_target_matrix[:, j, k],
-                predicted_values=vector_prediction_matrix[:, j, k],
-                num_bins=num_reliability_bins,
-                min_bin_edge=0., max_bin_edge=max_bin_edge, invert=False
-            )[:2]
-
-            if i == 0:
-                (
-                    t[VECTOR_RELIA_BIN_CENTER_KEY].values[j, k, :], _,
-                    t[VECTOR_RELIABILITY_COUNT_KEY].values[j, k, :]
-                ) = _get_rel_curve_one_scalar(
-                    target_values=full_vector_target_matrix[:, j, k],
-                    predicted_values=full_vector_prediction_matrix[:, j, k],
-                    num_bins=num_reliability_bins,
-                    min_bin_edge=0., max_bin_edge=max_bin_edge, invert=False
-                )
-
-            if num_examples == 0:
-                max_bin_edge = 1.
-            else:
-                max_bin_edge = numpy.percentile(
-                    full_vector_target_matrix[:, j, k], max_bin_edge_percentile
-                )
-
-            if i == 0:
-                (
-                    t[VECTOR_INV_RELIA_BIN_CENTER_KEY].values[j, k, :], _,
-                    t[VECTOR_INV_RELIABILITY_COUNT_KEY].values[j, k, :]
-                ) = _get_rel_curve_one_scalar(
-                    target_values=full_vector_target_matrix[:, j, k],
-                    predicted_values=full_vector_prediction_matrix[:, j, k],
-                    num_bins=num_reliability_bins,
-                    min_bin_edge=0., max_bin_edge=max_bin_edge, invert=True
-                )
+        t[VECTOR_INV_RELIA_BIN_CENTER_KEY].values[:] = these_x_matrix.reshape(
+            these_dim
+        )
+        t[VECTOR_INV_RELIABILITY_COUNT_KEY].values[:] = (
+            these_count_matrix.reshape(these_dim)
+        )
 
-    for k in range(num_aux_targets):
-        t[AUX_TARGET_STDEV_KEY].values[k, i] = numpy.std(
-            aux_target_matrix[:, k], ddof=1
+    if num_aux_targets > 0:
+        aux_diff_matrix = aux_prediction_matrix - aux_target_matrix
+
+        t[AUX_MSE_KEY].values[:, i] = numpy.mean(aux_diff_matrix ** 2, axis=0)
+        t[AUX_MAE_KEY].values[:, i] = numpy.mean(
+            numpy.abs(aux_diff_matrix), axis=0
         )
-        t[AUX_PREDICTION_STDEV_KEY].values[k, i] = numpy.std(
-            aux_prediction_matrix[:, k], ddof=1
+        t[AUX_BIAS_KEY].values[:, i] = numpy.mean(aux_diff_matrix, axis=0)
+        t[AUX_CORRELATION_KEY].values[:, i] = _get_correlation_all_columns(
+            target_matrix=aux_target_matrix,
+            prediction_matrix=aux_prediction_matrix
         )
-        t[AUX_MAE_KEY].values[k, i] = _get_mae_one_scalar(
-            target_values=aux_target_matrix[:, k],
-            predicted_values=aux_prediction_matrix[:, k]
+        t[AUX_TARGET_STDEV_KEY].values[:, i] = _get_stdevs_all_columns(
+            aux_target_matrix
         )
-        t[AUX_MSE_KEY].values[k, i] = _get_mse_one_scalar(
-            target_values=aux_target_matrix[:, k],
-            predicted_values=aux_prediction_matrix[:, k]
+        t[AUX_PREDICTION_STDEV_KEY].values[:, i] = _get_stdevs_all_columns(
+            aux_prediction_matrix
+        )
+        t[AUX_KGE_KEY].values[:, i] = _get_kge_all_columns(
+            target_matrix=aux_target_matrix,
+            prediction_matrix=aux_prediction_matrix
         )
 
+        # Each `t[...]` is an xarray lookup, so the arrays written inside the
+        # per-target loop are fetched once here.
+        aux_mae_skill_matrix = t[AUX_MAE_SKILL_KEY].values
+        aux_mse_skill_matrix = t[AUX_MSE_SKILL_KEY].values
+        aux_reliability_x_matrix = t[AUX_RELIABILITY_X_KEY].values
+        aux_reliability_y_matrix = t[AUX_RELIABILITY_Y_KEY].values
+        aux_bin_center_matrix = t[AUX_RELIA_BIN_CENTER_KEY].values
+        aux_count_matrix = t[AUX_RELIABILITY_COUNT_KEY].values
+        aux_inv_bin_center_matrix = t[AUX_INV_RELIA_BIN_CENTER_KEY].values
+        aux_inv_count_matrix = t[AUX_INV_RELIABILITY_COUNT_KEY].values
+
+        # Both tails for every auxiliary column come from one percentile call
+        # per matrix, as in the batched scalar and vector blocks.
+        these_percentile_levels = numpy.array([
+            100. - max_bin_edge_percentile, max_bin_edge_percentile
+        ])
+
+        if num_examples == 0:
+            aux_prediction_bin_edge_matrix = numpy.vstack((
+                numpy.full(num_aux_targets, 0.),
+                numpy.full(num_aux_targets, 1.)
+            ))
+            aux_target_bin_edge_matrix = aux_prediction_bin_edge_matrix
+        else:
+            aux_prediction_bin_edge_matrix = numpy.percentile(
+                full_aux_prediction_matrix, these_percentile_levels, axis=0
+            )
+            aux_target_bin_edge_matrix = numpy.percentile(
+                full_aux_target_matrix, these_percentile_levels, axis=0
+            )
+
+    for k in range(num_aux_targets):
         if (
                 aux_target_field_names[k] == NET_FLUX_NAME and
                 climo_net_flux_w_m02 is not None
         ):
-            t[AUX_MAE_SKILL_KEY].values[k, i] = _get_mae_ss_one_scalar(
+            aux_mae_skill_matrix[k, i] = _get_mae_ss_one_scalar(
                 target_values=aux_target_matrix[:, k],
                 predicted_values=aux_prediction_matrix[:, k],
                 mean_training_target_value=climo_net_flux_w_m02
             )
-            t[AUX_MSE_SKILL_KEY].values[k, i] = _get_mse_ss_one_scalar(
+            aux_mse_skill_matrix[k, i] = _get_mse_ss_one_scalar(
                 target_values=aux_target_matrix[:, k],
                 predicted_values=aux_prediction_matrix[:, k],
                 mean_training_target_value=climo_net_flux_w_m02
             )
 
-        t[AUX_BIAS_KEY].values[k, i] = _get_bias_one_scalar(
-            target_values=aux_target_matrix[:, k],
-            predicted_values=aux_prediction_matrix[:, k]
-        )
-        t[AUX_CORRELATION_KEY].values[k, i] = _get_correlation_one_scalar(
-            target_values=aux_target_matrix[:, k],
-            predicted_values=aux_prediction_matrix[:, k]
-        )
-        t[AUX_KGE_KEY].values[k, i] = _get_kge_one_scalar(
-            target_values=aux_target_matrix[:, k],
-            predicted_values=aux_prediction_matrix[:, k]
-        )
-
-        if num_examples == 0:
-            min_bin_edge = 0.
-            max_bin_edge = 1.
-        else:
-            min_bin_edge = numpy.percentile(
-                full_aux_prediction_matrix[:, k], 100. - max_bin_edge_percentile
-            )
-            max_bin_edge = numpy.percentile(
-                full_aux_prediction_matrix[:, k], max_bin_edge_percentile
-            )
+        min_bin_edge = aux_prediction_bin_edge_matrix[0, k]
+        max_bin_edge = aux_prediction_bin_edge_matrix[1, k]
 
         (
-            t[AUX_RELIABILITY_X_KEY].values[k, :, i],
-            t[AUX_RELIABILITY_Y_KEY].values[k, :, i]
+            aux_reliability_x_matrix[k, :, i],
+            aux_reliability_y_matrix[k, :, i]
         ) = _get_rel_curve_one_scalar(
             target_values=aux_target_matrix[:, k],
             predicted_values=aux_prediction_matrix[:, k],
@@ -681,8 +938,8 @@ def _get_scores_one_replicate(
 
         if i == 0:
             (
-                t[AUX_RELIA_BIN_CENTER_KEY].values[k, :], _,
-                t[AUX_RELIABILITY_COUNT_KEY].values[k, :]
+                aux_bin_center_matrix[k, :], _,
+                aux_count_matrix[k, :]
             ) = _get_rel_curve_one_scalar(
                 target_values=full_aux_target_matrix[:, k],
                 predicted_values=full_aux_prediction_matrix[:, k],
@@ -690,21 +947,13 @@ def _get_scores_one_replicate(
                 max_bin_edge=max_bin_edge, invert=False
             )
 
-        if num_examples == 0:
-            min_bin_edge = 0.
-            max_bin_edge = 1.
-        else:
-            min_bin_edge = numpy.percentile(
-                full_aux_target_matrix[:, k], 100. - max_bin_edge_percentile
-            )
-            max_bin_edge = numpy.percentile(
-                full_aux_target_matrix[:, k], max_bin_edge_percentile
-            )
+        min_bin_edge = aux_target_bin_edge_matrix[0, k]
+        max_bin_edge = aux_target_bin_edge_matrix[1, k]
 
         if i == 0:
             (
-                t[AUX_INV_RELIA_BIN_CENTER_KEY].values[k, :], _,
-                t[AUX_INV_RELIABILITY_COUNT_KEY].values[k, :]
+                aux_inv_bin_center_matrix[k, :], _,
+                aux_inv_count_matrix[k, :]
             ) = _get_rel_curve_one_scalar(
                 target_values=full_aux_target_matrix[:, k],
                 predicted_values=full_aux_prediction_matrix[:, k],
@@ -1039,6 +1288,27 @@ def get_scores_all_variables(
     surface_down_flux_index = aux_prediction_dict[SURFACE_DOWN_FLUX_INDEX_KEY]
     toa_up_flux_index = aux_prediction_dict[TOA_UP_FLUX_INDEX_KEY]
 
+    # The reductions below are memory-bound, so the matrices are cast once to
+    # single precision to halve memory traffic.  Accumulators that are prone
+    # to cancellation still run in double precision (see
+    # `_get_stdevs_all_columns`).
+    scalar_target_matrix = scalar_target_matrix.astype(
+        numpy.float32, copy=False
+    )
+    scalar_prediction_matrix = scalar_prediction_matrix.astype(
+        numpy.float32, copy=False
+    )
+    vector_target_matrix = vector_target_matrix.astype(
+        numpy.float32, copy=False
+    )
+    vector_prediction_matrix = vector_prediction_matrix.astype(
+        numpy.float32, copy=False
+    )
+    aux_target_matrix = aux_target_matrix.astype(numpy.float32, copy=False)
+    aux_prediction_matrix = aux_prediction_matrix.astype(
+        numpy.float32, copy=False
+    )
+
     if surface_down_flux_index >= 0 and toa_up_flux_index >= 0:
         this_key = example_utils.SCALAR_TARGET_VALS_KEY
         climo_net_flux_w_m02 = (
@@ -177,7 +177,9 @@ def get_examples_for_inference(
     )
 
     predictor_matrix = predictor_matrix[good_indices, ...]
-    example_id_strings = [example_id_strings[i] for i in good_indices]
+    example_id_strings = numpy.asarray(
+        example_id_strings, dtype=object
+    )[good_indices].tolist()
 
     if isinstance(target_array, list):
         target_array = [t[good_indices, ...] for t in target_array]
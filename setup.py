@@ -30,6 +30,7 @@ CLASSIFIERS = [
 
 PACKAGE_REQUIREMENTS = [
     'numpy',
+    'numba',
     'scipy',
     'tensorflow',
     'keras',